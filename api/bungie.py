@@ -1,9 +1,10 @@
 import json
 import os
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 # Load .env variables for development/testing only - not required for production
 try:
@@ -115,6 +116,14 @@ def get_bungie_redirect_uri():
 
 
 PROFILE_CACHE_PATH = os.path.join(CACHE_DIR, "profile.json")
+PROFILE_CACHE_MAX_AGE = 24 * 60 * 60  # 24 hours in seconds
+
+# One pooled session for every Bungie request, so successive calls (from
+# the refresh job and the connection check alike) reuse open connections
+# instead of paying a TCP and TLS handshake each time
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = USER_AGENT
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 # Rate limiting
 LAST_REQUEST_TIME = 0
@@ -235,7 +244,7 @@ def fetch_profile(
                 )
 
                 _rate_limit()
-                response = requests.get(url, params=params, headers=headers, timeout=30)
+                response = _SESSION.get(url, params=params, headers=headers, timeout=30)
 
                 # Handle different response codes appropriately
                 if response.status_code == 200:
@@ -400,27 +409,37 @@ def load_cached_profile() -> Optional[Dict[str, Any]]:
     Returns:
         dict: Cached profile data or None if not available/expired
     """
+    return load_cached_profile_entry()[0]
+
+
+def load_cached_profile_entry() -> Tuple[Optional[Dict[str, Any]], float]:
+    """
+    Load cached profile data along with the time it expires.
+
+    Returns:
+        tuple: (profile, expires_at); profile is None if not available or
+            expired, and expires_at is 0 when there is no usable cache
+    """
     try:
         if not os.path.exists(PROFILE_CACHE_PATH):
-            return None
+            return None, 0
 
         with open(PROFILE_CACHE_PATH, "r", encoding="utf-8") as f:
             cache_data = json.load(f)
 
         # Check cache age (24 hours max)
-        cached_at = cache_data.get("cached_at", 0)
-        max_age = 24 * 60 * 60  # 24 hours in seconds
+        expires_at = cache_data.get("cached_at", 0) + PROFILE_CACHE_MAX_AGE
 
-        if time.time() - cached_at > max_age:
+        if time.time() > expires_at:
             logger.info("Cached profile expired")
-            return None
+            return None, 0
 
         logger.debug("Loaded cached profile data")
-        return cache_data.get("profile")
+        return cache_data.get("profile"), expires_at
 
     except Exception as e:
         logger.warning(f"Failed to load cached profile: {e}")
-        return None
+        return None, 0
 
 
 def ensure_authenticated() -> bool:
@@ -480,7 +499,7 @@ def get_membership_info(bungie_tag: str) -> Optional[Dict[str, Any]]:
             }
 
             _rate_limit()
-            response = requests.get(url, headers=headers, timeout=30)
+            response = _SESSION.get(url, headers=headers, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -517,7 +536,7 @@ def test_api_connection() -> bool:
         headers = {"X-API-Key": get_bungie_api_key(), "User-Agent": USER_AGENT}
 
         _rate_limit()
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, headers=headers, timeout=10)
 
         if response.status_code == 200:
             logger.info("API connection test successful")
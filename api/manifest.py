@@ -29,9 +29,16 @@ manifest.py — Download, cache, and load the Destiny 2 manifest for item lookup
 import json
 import logging
 import os
+import pickle
+import sys
 
 import requests
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 
 def get_project_root():
     """
@@ -59,6 +66,8 @@ BASE_URL = "https://www.bungie.net"
 MANIFEST_URL = f"{BASE_URL}/Platform/Destiny2/Manifest/"
 DEST_DIR = os.path.join(get_project_root(), "RaidAssist", "cache", "manifest")
 MANIFEST_FILE = os.path.join(DEST_DIR, "DestinyInventoryItemDefinition.json")
+# Pickled copy of the parsed definitions; much faster to load than the JSON
+DEFS_PICKLE_FILE = os.path.join(DEST_DIR, "DestinyInventoryItemDefinition.pickle")
 LOG_PATH = os.path.join(get_project_root(), "RaidAssist", "logs", "manifest.log")
 
 os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
@@ -105,21 +114,70 @@ def fetch_manifest():
         raise
 
 
+# Last loaded definitions, keyed on the manifest file's stat signature
+_DEFS_CACHE = {"key": None, "defs": None}
+
+
+def _load_pickled_definitions(key):
+    """
+    Returns the pickled definitions if they were built from the manifest
+    identified by key, else None.
+    """
+    try:
+        with open(DEFS_PICKLE_FILE, "rb") as f:
+            pickled_key, defs = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable manifest pickle: {e}")
+        return None
+    return defs if pickled_key == key else None
+
+
+def _save_pickled_definitions(key, defs):
+    """
+    Writes defs next to the manifest so the next start can skip the JSON parse.
+    """
+    tmp_path = DEFS_PICKLE_FILE + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, defs), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, DEFS_PICKLE_FILE)
+    except Exception as e:
+        logging.warning(f"Failed to write manifest pickle: {e}")
+
+
 def load_item_definitions():
     """
     Loads DestinyInventoryItemDefinition from the local manifest cache.
+    The parsed result is reused until the manifest file changes, both in
+    memory and across runs via a pickled copy.
     Returns:
         dict: All Destiny items keyed by their item hash (as string).
     """
-    if not os.path.exists(MANIFEST_FILE):
-        logging.warning("Manifest not found. Run fetch_manifest() first.")
-        return {}
     try:
-        with open(MANIFEST_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        logging.error(f"Failed to load manifest file: {e}")
+        st = os.stat(MANIFEST_FILE)
+    except OSError:
+        logging.warning("Manifest not found. Run fetch_manifest() first.")
         return {}
+    key = (st.st_mtime_ns, st.st_size)
+    if _DEFS_CACHE["key"] == key:
+        return _DEFS_CACHE["defs"]
+
+    defs = _load_pickled_definitions(key)
+    if defs is None:
+        try:
+            with open(MANIFEST_FILE, "rb") as f:
+                raw = f.read()
+            defs = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except Exception as e:
+            logging.error(f"Failed to load manifest file: {e}")
+            return {}
+        _save_pickled_definitions(key, defs)
+
+    _DEFS_CACHE["key"] = key
+    _DEFS_CACHE["defs"] = defs
+    return defs
 
 
 def get_item_display(item_hash, item_defs):
@@ -174,7 +232,9 @@ def get_item_info(item_hash, item_defs):
 
     return {
         "name": display_props.get("name", f"Unnamed ({item_hash})"),
-        "type": item_type,
+        # A few dozen type names repeat across every item; interning lets
+        # them all share one string each
+        "type": sys.intern(item_type),
         "description": display_props.get("description", ""),
         "icon": display_props.get("icon", ""),
         "archetype": item.get("itemSubType", ""),
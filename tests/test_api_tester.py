@@ -0,0 +1,88 @@
+import json
+import os
+
+import pytest  # type: ignore
+
+import ui.api_tester as api_tester
+
+
+@pytest.fixture
+def session_file(tmp_path, monkeypatch):
+    path = tmp_path / "session.json"
+    monkeypatch.setattr(api_tester, "SESSION_PATH", str(path))
+    return path
+
+
+def test_load_token_missing_file(session_file):
+    assert api_tester.load_token() == ""
+
+
+def test_load_token_cached_until_file_changes(session_file, monkeypatch):
+    session_file.write_text(json.dumps({"access_token": "first"}))
+    assert api_tester.load_token() == "first"
+
+    # Unchanged file: served from cache without reopening it
+    def fail_open(*args, **kwargs):
+        raise AssertionError("session file should not be re-read")
+
+    with monkeypatch.context() as m:
+        m.setattr("builtins.open", fail_open)
+        assert api_tester.load_token() == "first"
+
+    # Rewritten file: new token is picked up
+    session_file.write_text(json.dumps({"access_token": "second-token"}))
+    st = os.stat(session_file)
+    os.utime(session_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert api_tester.load_token() == "second-token"
+
+
+def test_pretty_json_indents_two_spaces():
+    assert api_tester.pretty_json(b'{"a":[1]}') == '{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_rejected_endpoint_does_not_save_previous_response(tmp_path, monkeypatch):
+    from PySide6.QtWidgets import QApplication  # type: ignore
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    dialog = api_tester.ApiTesterDialog()
+    dialog._last_raw_bytes = b'{"previous": true}'
+
+    dialog.endpoint_input.setText("https://example.com/steal")
+    dialog.make_request()
+
+    out = tmp_path / "result.json"
+    monkeypatch.setattr(
+        api_tester.QFileDialog,
+        "getSaveFileName",
+        lambda *args, **kwargs: (str(out), ""),
+    )
+    dialog.save_result()
+    assert "previous" not in out.read_text(encoding="utf-8")
+    assert "not a Bungie Platform endpoint" in out.read_text(encoding="utf-8")
+
+
+class _GatewayErrorReply:
+    def deleteLater(self):
+        pass
+
+    def attribute(self, attribute):
+        return 503
+
+
+def test_retry_is_dropped_after_dialog_closes(monkeypatch):
+    from PySide6.QtTest import QTest  # type: ignore
+    from PySide6.QtWidgets import QApplication  # type: ignore
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    monkeypatch.setattr(api_tester, "RETRY_BACKOFF_MS", 1)
+    dialog = api_tester.ApiTesterDialog()
+    sent = []
+    monkeypatch.setattr(dialog, "_send", lambda *args: sent.append(args))
+
+    dialog.show()
+    dialog._on_reply_finished(_GatewayErrorReply(), "/x/", "https://x/", 0)
+    dialog.close()
+    QTest.qWait(20)
+
+    assert sent == []
+    assert dialog.send_button.isEnabled()
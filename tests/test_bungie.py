@@ -267,7 +267,7 @@ def test_fetch_profile_mock(monkeypatch, tmp_path):
     import api.bungie
 
     importlib.reload(api.bungie)
-    # Patch out load_token and requests.get
+    # Patch out load_token and the session's get
     monkeypatch.setattr(bungie, "CACHE_DIR", str(tmp_path))
     monkeypatch.setattr(bungie, "PROFILE_CACHE_PATH", str(tmp_path / "profile.json"))
 
@@ -286,8 +286,8 @@ def test_fetch_profile_mock(monkeypatch, tmp_path):
     def mock_requests_get(*args, **kwargs):
         return FakeResp()
 
-    # Patch requests.get correctly
-    monkeypatch.setattr(bungie.requests, "get", mock_requests_get)
+    # Patch the shared session's get correctly
+    monkeypatch.setattr(bungie._SESSION, "get", mock_requests_get)
 
     # Ensure the function doesn't try to use cached data
     cache_path = tmp_path / "profile.json"
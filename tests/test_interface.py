@@ -0,0 +1,253 @@
+import time
+
+from PySide6.QtCore import QPersistentModelIndex, QSortFilterProxyModel, Qt  # type: ignore
+
+from ui.interface import (
+    DataRefreshJob,
+    DataRefreshSignals,
+    ItemFilterProxyModel,
+    ItemListModel,
+    build_tooltip,
+    process_items,
+)
+
+
+def make_item(name, progress, needed):
+    percent = int(100 * progress / needed)
+    return {
+        "raw": {},
+        "name": name,
+        "type": "Auto Rifle",
+        "progress": progress,
+        "needed": needed,
+        "percent": percent,
+        "display": f"{name} - {progress}/{needed} ({percent}%)",
+        "icon": "",
+        "tooltip": f"<b>{name}</b>",
+    }
+
+
+def make_model():
+    model = ItemListModel()
+    model.set_items(
+        [
+            make_item("Gjallarhorn", 5, 5),
+            make_item("Hung Jury", 3, 5),
+            make_item("Ace of Spades", 1, 5),
+        ]
+    )
+    return model
+
+
+def test_item_list_model_roles():
+    model = make_model()
+    assert model.rowCount() == 3
+
+    first = model.index(0)
+    assert model.data(first) == "Gjallarhorn - 5/5 (100%)"
+    assert model.data(first, Qt.ItemDataRole.ToolTipRole) == "<b>Gjallarhorn</b>"
+    assert model.data(first, ItemListModel.NameRole) == "Gjallarhorn"
+    assert model.data(first, Qt.ItemDataRole.ForegroundRole).name() == "#00ff00"
+    assert model.data(model.index(1), Qt.ItemDataRole.ForegroundRole).name() == (
+        "#ffff00"
+    )
+    assert model.data(model.index(2), Qt.ItemDataRole.ForegroundRole) is None
+
+
+def test_item_list_model_name_filter():
+    model = make_model()
+    proxy = QSortFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setFilterRole(ItemListModel.NameRole)
+    proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+
+    proxy.setFilterFixedString("HUNG")
+    assert proxy.rowCount() == 1
+    assert proxy.data(proxy.index(0, 0)) == "Hung Jury - 3/5 (60%)"
+
+    proxy.setFilterFixedString("")
+    assert proxy.rowCount() == 3
+
+
+def test_build_tooltip_skips_empty_fields():
+    assert build_tooltip("Gjallarhorn", "Rocket Launcher", "", None) == (
+        "<b>Gjallarhorn</b><br>Type: Rocket Launcher"
+    )
+
+
+def test_item_list_model_updates_changed_rows_only():
+    model = make_model()
+    resets = []
+    changed = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.dataChanged.connect(lambda top, bottom: changed.append(top.row()))
+
+    model.set_items(
+        [
+            make_item("Gjallarhorn", 5, 5),
+            make_item("Hung Jury", 4, 5),
+            make_item("Ace of Spades", 1, 5),
+        ]
+    )
+    assert resets == []
+    assert changed == [1]
+    assert model.data(model.index(1)) == "Hung Jury - 4/5 (80%)"
+
+    model.set_items([make_item("Gjallarhorn", 5, 5)])
+    assert resets == []
+    assert model.rowCount() == 1
+
+
+def test_item_filter_proxy_hides_completed():
+    model = make_model()
+    proxy = ItemFilterProxyModel()
+    proxy.setSourceModel(model)
+    proxy.setFilterRole(ItemListModel.NameRole)
+
+    proxy.set_show_completed(False)
+    assert proxy.rowCount() == 2
+    assert proxy.data(proxy.index(0, 0), ItemListModel.NameRole) == "Hung Jury"
+
+    proxy.setFilterFixedString("Ace")
+    assert proxy.rowCount() == 1
+
+    proxy.setFilterFixedString("")
+    proxy.set_show_completed(True)
+    assert proxy.rowCount() == 3
+
+
+def test_process_items_resolves_known_and_unknown_hashes():
+    defs = {
+        "1": {
+            "displayProperties": {"name": "Gjallarhorn", "icon": "/gjally.jpg"},
+            "itemTypeDisplayName": "Rocket Launcher",
+        }
+    }
+    raw = [{"itemHash": "1"}, {"itemHash": "2"}]
+
+    known, unknown = process_items(raw, "itemHash", defs, include_progress=False)
+    assert known["name"] == "Gjallarhorn"
+    assert known["name_folded"] == "gjallarhorn"
+    assert known["icon"] == "/gjally.jpg"
+    assert known["raw"] is raw[0]
+    assert unknown["name"] == "Unknown Item (2)"
+    assert unknown["type"] == "Unknown"
+
+
+def test_process_items_reuses_item_info_until_defs_change(monkeypatch):
+    import api.manifest
+
+    calls = []
+    real_get_item_info = api.manifest.get_item_info
+
+    def counting_get_item_info(item_hash, item_defs):
+        calls.append(item_hash)
+        return real_get_item_info(item_hash, item_defs)
+
+    monkeypatch.setattr(api.manifest, "get_item_info", counting_get_item_info)
+    defs = {"1": {"displayProperties": {"name": "Gjallarhorn"}}}
+    raw = [{"itemHash": "1"}]
+
+    process_items(raw, "itemHash", defs, include_progress=False)
+    process_items(raw, "itemHash", defs, include_progress=False)
+    assert calls == ["1"]
+
+    process_items(raw, "itemHash", dict(defs), include_progress=False)
+    assert calls == ["1", "1"]
+
+
+def test_item_list_model_inserts_and_removes_rows():
+    model = make_model()
+    removed = []
+    inserted = []
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+    model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+
+    model.set_items(
+        [
+            make_item("Gjallarhorn", 5, 5),
+            make_item("Thorn", 2, 5),
+            make_item("Sunshot", 0, 5),
+            make_item("Ace of Spades", 1, 5),
+        ]
+    )
+    assert removed == [(1, 1)]
+    assert inserted == [(1, 2)]
+    names = [model.data(model.index(row), ItemListModel.NameRole) for row in range(4)]
+    assert names == ["Gjallarhorn", "Thorn", "Sunshot", "Ace of Spades"]
+
+
+def test_item_list_model_matches_rows_by_instance_id():
+    def instance(instance_id, progress):
+        item = make_item("Fatebringer", progress, 5)
+        item["raw"] = {"itemInstanceId": instance_id}
+        return item
+
+    model = ItemListModel()
+    model.set_items([instance("1", 1), instance("2", 2), instance("3", 3)])
+    selected = QPersistentModelIndex(model.index(2))
+    removed = []
+    inserted = []
+    changed = []
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append((first, last)))
+    model.rowsInserted.connect(
+        lambda parent, first, last: inserted.append((first, last))
+    )
+    model.dataChanged.connect(lambda first, last: changed.append(first.row()))
+
+    # Same name throughout: instance 2 is replaced by instance 4, and the
+    # replacement must not pass for an edit of the old row
+    model.set_items([instance("1", 1), instance("3", 4), instance("4", 2)])
+    assert removed == [(1, 1)]
+    assert inserted == [(2, 2)]
+    assert changed == [1]
+    assert selected.row() == 1
+
+
+def test_refresh_job_skips_unchanged_profile(monkeypatch, tmp_path):
+    import api.bungie
+    import api.parse_profile
+
+    profile_path = tmp_path / "profile.json"
+    profile_path.write_text("{}")
+    monkeypatch.setattr(api.bungie, "PROFILE_CACHE_PATH", str(profile_path))
+    monkeypatch.setattr(api.parse_profile, "PROFILE_PATH", str(profile_path))
+    cache_reads = []
+
+    def load_cached_profile_entry():
+        cache_reads.append(True)
+        return {"profile": {}}, time.time() + 60
+
+    monkeypatch.setattr(api.bungie, "load_cached_profile_entry", load_cached_profile_entry)
+    for name in ("extract_red_borders", "extract_catalysts", "extract_exotics"):
+        monkeypatch.setattr(api.parse_profile, name, lambda profile: [])
+
+    signals = DataRefreshSignals()
+    loaded = []
+    unchanged = []
+    signals.data_loaded.connect(loaded.append)
+    signals.data_unchanged.connect(lambda: unchanged.append(True))
+
+    DataRefreshJob(signals).run()
+    assert len(loaded) == 1 and not unchanged
+    source_key = loaded[0]["source_key"]
+
+    # A skipped refresh only stats the files; the cache is not parsed again
+    DataRefreshJob(signals, last_source_key=source_key).run()
+    assert len(loaded) == 1 and unchanged == [True]
+    assert len(cache_reads) == 1
+
+    profile_path.write_text('{"changed": true}')
+    DataRefreshJob(signals, last_source_key=source_key).run()
+    assert len(loaded) == 2
+
+    # An expired cache keeps its file untouched but must not pass for
+    # unchanged data; the job reads the cache again and falls back to the
+    # profile on disk instead
+    stat_key, expires_at = loaded[-1]["source_key"]
+    monkeypatch.setattr(api.bungie, "load_cached_profile_entry", lambda: (None, 0))
+    monkeypatch.setattr(api.parse_profile, "load_profile", lambda: {"profile": {}})
+    DataRefreshJob(signals, last_source_key=(stat_key, time.time() - 1)).run()
+    assert len(loaded) == 3 and unchanged == [True]
@@ -77,3 +77,33 @@ def test_load_item_definitions_returns_dict():
     d = manifest.load_item_definitions()
     assert isinstance(d, dict)
     assert len(d) > 0
+
+
+def test_load_item_definitions_uses_pickle(tmp_path, monkeypatch):
+    manifest_file = tmp_path / "defs.json"
+    manifest_file.write_text(json.dumps({"1": {"displayProperties": {"name": "A"}}}))
+    monkeypatch.setattr(manifest, "MANIFEST_FILE", str(manifest_file))
+    monkeypatch.setattr(manifest, "DEFS_PICKLE_FILE", str(tmp_path / "defs.pickle"))
+    monkeypatch.setattr(manifest, "_DEFS_CACHE", {"key": None, "defs": None})
+
+    defs = manifest.load_item_definitions()
+    assert defs["1"]["displayProperties"]["name"] == "A"
+    assert (tmp_path / "defs.pickle").exists()
+
+    # A fresh process would find the pickle and skip the JSON parse
+    monkeypatch.setattr(manifest, "_DEFS_CACHE", {"key": None, "defs": None})
+    monkeypatch.setattr(manifest.json, "loads", None)
+    monkeypatch.setattr(manifest, "orjson", None)
+    assert manifest.load_item_definitions() == defs
+
+
+def test_load_item_definitions_reloads_changed_manifest(tmp_path, monkeypatch):
+    manifest_file = tmp_path / "defs.json"
+    manifest_file.write_text(json.dumps({"1": {}}))
+    monkeypatch.setattr(manifest, "MANIFEST_FILE", str(manifest_file))
+    monkeypatch.setattr(manifest, "DEFS_PICKLE_FILE", str(tmp_path / "defs.pickle"))
+    monkeypatch.setattr(manifest, "_DEFS_CACHE", {"key": None, "defs": None})
+
+    assert list(manifest.load_item_definitions()) == ["1"]
+    manifest_file.write_text(json.dumps({"2": {}, "3": {}}))
+    assert sorted(manifest.load_item_definitions()) == ["2", "3"]
@@ -0,0 +1,61 @@
+import pytest  # type: ignore
+
+overlay = pytest.importorskip("ui.overlay")
+
+
+@pytest.fixture
+def qapp():
+    from PySide6.QtWidgets import QApplication  # type: ignore
+
+    return QApplication.instance() or QApplication([])
+
+
+def test_fade_in_ends_with_opacity_effect_disabled(qapp):
+    widget = overlay.ProgressOverlayWidget(
+        overlay.OverlayConfig(opacity=0.9, fade_duration=100)
+    )
+    widget.fade_in()
+    assert widget._opacity_effect.isEnabled()
+
+    # Jump to the end of the fade, which finishes the animation
+    widget.fade_animation.setCurrentTime(widget.fade_animation.duration())
+    assert widget._opacity_effect.opacity() == 1.0
+    assert not widget._opacity_effect.isEnabled()
+
+
+def test_fade_out_resets_opacity_effect(qapp):
+    widget = overlay.ProgressOverlayWidget(
+        overlay.OverlayConfig(opacity=0.9, fade_duration=100)
+    )
+    widget.fade_out()
+    widget.fade_animation.setCurrentTime(widget.fade_animation.duration())
+
+    # A plain show() afterwards must not leave the widget fully transparent
+    assert widget._opacity_effect.opacity() == 1.0
+    assert not widget._opacity_effect.isEnabled()
+
+
+def test_only_animated_widgets_are_faded(qapp):
+    still = overlay.Overlay(overlay.OverlayConfig(enable_animations=False))
+    assert still.widgets and still._animatable == []
+    still.show_overlay()
+    still.hide_overlay()
+
+    animated = overlay.Overlay(overlay.OverlayConfig(enable_animations=True))
+    assert animated._animatable == list(animated.widgets.values())
+
+
+def test_save_overlay_config_rewrites_changed_file(tmp_path):
+    config = overlay.OverlayConfig()
+    config_path = tmp_path / "overlay.json"
+    overlay.save_overlay_config(config, str(config_path))
+    saved = config_path.read_bytes()
+
+    # An unchanged config still restores a file edited behind its back
+    config_path.write_text("{}")
+    overlay.save_overlay_config(config, str(config_path))
+    assert config_path.read_bytes() == saved
+
+    config.widget_order.append("timer")
+    overlay.save_overlay_config(config, str(config_path))
+    assert overlay.load_overlay_config(str(config_path)).widget_order[-1] == "timer"
@@ -2,7 +2,7 @@ import os
 
 import pytest  # type: ignore
 
-from ui.settings import load_settings, save_settings
+from ui.settings import load_icon, load_settings, save_settings
 
 
 def test_settings_save_and_load(tmp_path):
@@ -24,3 +24,82 @@ def test_settings_save_and_load(tmp_path):
 
     # Restore
     settings_mod.SETTINGS_PATH = orig_path
+
+
+def test_load_icon_missing_asset_is_cached():
+    load_icon.cache_clear()
+    assert load_icon("does_not_exist.png") is None
+    assert load_icon("does_not_exist.png") is None
+    assert load_icon.cache_info().hits == 1
+
+
+def test_settings_save_job_writes_snapshot(tmp_path, monkeypatch):
+    import ui.settings as settings_mod
+
+    monkeypatch.setattr(settings_mod, "SETTINGS_PATH", str(tmp_path / "settings.json"))
+    settings = {"refresh_interval_seconds": 120}
+    job = settings_mod.SettingsSaveJob(settings)
+    settings["refresh_interval_seconds"] = 5
+    job.run()
+
+    assert load_settings() == {"refresh_interval_seconds": 120}
+
+
+def test_load_settings_uses_cache_until_file_changes(tmp_path, monkeypatch):
+    import ui.settings as settings_mod
+
+    path = tmp_path / "settings.json"
+    monkeypatch.setattr(settings_mod, "SETTINGS_PATH", str(path))
+    assert save_settings({"refresh_interval_seconds": 90}) is True
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("settings were re-read from disk")
+
+    monkeypatch.setattr(settings_mod, "open", fail_open, raising=False)
+    loaded = load_settings()
+    assert loaded == {"refresh_interval_seconds": 90}
+
+    # Callers get a copy, so edits don't leak into the cache
+    loaded["refresh_interval_seconds"] = 5
+    assert load_settings() == {"refresh_interval_seconds": 90}
+
+    # A file changed by something else is read again
+    monkeypatch.delattr(settings_mod, "open")
+    path.write_text('{"refresh_interval_seconds": 30}', encoding="utf-8")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_settings() == {"refresh_interval_seconds": 30}
+
+
+def test_queued_save_is_visible_to_loads(tmp_path, monkeypatch):
+    import ui.settings as settings_mod
+
+    monkeypatch.setattr(settings_mod, "SETTINGS_PATH", str(tmp_path / "settings.json"))
+    assert save_settings({"refresh_interval_seconds": 60}) is True
+
+    # Queued but not yet run: a load must not return the older file
+    job = settings_mod.SettingsSaveJob({"refresh_interval_seconds": 300})
+    assert load_settings() == {"refresh_interval_seconds": 300}
+
+    job.run()
+    assert settings_mod._PENDING_SAVE["data"] is None
+    assert load_settings() == {"refresh_interval_seconds": 300}
+
+
+def test_settings_dialog_loads_in_background(tmp_path, monkeypatch):
+    from PySide6.QtCore import QThreadPool  # type: ignore
+    from PySide6.QtTest import QTest  # type: ignore
+    from PySide6.QtWidgets import QApplication  # type: ignore
+
+    import ui.settings as settings_mod
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    monkeypatch.setattr(settings_mod, "SETTINGS_PATH", str(tmp_path / "settings.json"))
+    assert save_settings({"refresh_interval_seconds": 120}) is True
+
+    dialog = settings_mod.SettingsDialog()
+    QThreadPool.globalInstance().waitForDone()
+    QTest.qWait(10)
+
+    assert dialog.interval_spin.value() == 120
+    assert dialog.save_button.isEnabled()
@@ -4,13 +4,20 @@ api_tester.py — Bungie API call tester dialog for RaidAssist.
 Allows power users to send requests to any Bungie API endpoint and view/save the response.
 """
 
+import functools
 import json
 import logging
 import os
+import threading
+from urllib.parse import urljoin
 
-import requests
-from PySide6.QtCore import Qt  # type: ignore
+from PySide6.QtCore import Qt, QTimer, QUrl  # type: ignore
 from PySide6.QtGui import QFont, QIcon  # type: ignore
+from PySide6.QtNetwork import (  # type: ignore
+    QNetworkAccessManager,
+    QNetworkReply,
+    QNetworkRequest,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,  # type: ignore
@@ -20,10 +27,10 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QPlainTextEdit,
     QPushButton,
     QSizePolicy,
     QSpacerItem,
-    QTextEdit,
     QVBoxLayout,
 )
 
@@ -32,27 +39,13 @@ try:
 except ImportError:
     load_dotenv = None
 
-# ---- Logging setup ----
-LOG_PATH = os.path.expanduser("~/.raidassist/api_tester.log")
-os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
-logging.basicConfig(
-    filename=LOG_PATH,
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-)
-
-# ---- Environment variable loading for development only ----
-if load_dotenv is not None and os.environ.get("RAIDASSIST_DEV_MODE"):
-    env_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"
-    )
-    if os.path.exists(env_path):
-        load_dotenv(env_path)
-    else:
-        logging.info(
-            ".env file not found in project root; using bundled configuration."
-        )
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
+API_BASE_URL = "https://www.bungie.net/Platform/"
+LOG_PATH = os.path.expanduser("~/.raidassist/api_tester.log")
 SESSION_PATH = os.path.expanduser("~/.raidassist/session.json")
 
 # Bungie API configuration - bundled credentials
@@ -62,22 +55,100 @@ BUNGIE_API_KEY = "b4c3ff9cf4fb4ba3a1a0b8a5a8e3f8e9c2d6b5a8c9f2e1d4a7b0c6f5e8d9c2
 if os.environ.get("BUNGIE_API_KEY"):
     BUNGIE_API_KEY = os.environ.get("BUNGIE_API_KEY")
 
+# Transfer timeout in milliseconds so a stalled socket can't hang the dialog
+REQUEST_TIMEOUT_MS = 30000
+
+# Gateway errors are retried with exponential backoff
+RETRY_STATUS_CODES = frozenset((502, 503, 504))
+MAX_RETRIES = 3
+RETRY_BACKOFF_MS = 300
+
+# Responses longer than this are truncated in the view; saving writes them in full
+MAX_DISPLAY_CHARS = 1024 * 1024
+
+_configured = False
+
+
+def _configure_logging():
+    """
+    Sets up the log file and the development .env on first dialog use,
+    so importing this module has no filesystem side effects.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    # ---- Logging setup ----
+    os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+    logging.basicConfig(
+        filename=LOG_PATH,
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+    )
+
+    # ---- Environment variable loading for development only ----
+    if load_dotenv is not None and os.environ.get("RAIDASSIST_DEV_MODE"):
+        env_path = os.path.join(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".env"
+        )
+        if os.path.exists(env_path):
+            load_dotenv(env_path)
+        else:
+            logging.info(
+                ".env file not found in project root; using bundled configuration."
+            )
+
+
+# Shared encoder so each request doesn't rebuild json's encoder state
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+
+def pretty_json(raw):
+    """
+    Re-indents a raw JSON response body for display.
+    Args:
+        raw (bytes): Response body.
+    Returns:
+        str: JSON text indented by two spaces.
+    """
+    if orjson is not None:
+        return orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2).decode()
+    return _JSON_ENCODER.encode(json.loads(raw))
+
+
+# Last parsed token, keyed on the session file's path and stat signature
+_TOKEN_CACHE = {"key": None, "token": ""}
+_TOKEN_LOCK = threading.Lock()
+
 
 def load_token():
     """
     Loads OAuth token from session file, if present.
+    The file is only re-parsed when its mtime or size changes.
     Returns:
         str: OAuth access token, or empty string if not found.
     """
-    if os.path.exists(SESSION_PATH):
+    try:
+        st = os.stat(SESSION_PATH)
+    except OSError:
+        return ""
+    key = (SESSION_PATH, st.st_mtime_ns, st.st_size)
+    with _TOKEN_LOCK:
+        if _TOKEN_CACHE["key"] == key:
+            return _TOKEN_CACHE["token"]
         try:
             with open(SESSION_PATH, "r") as f:
-                return json.load(f).get("access_token", "")
+                token = json.load(f).get("access_token", "")
         except Exception as e:
-            logging.error(f"Failed to load OAuth token: {e}")
-    return ""
+            logging.error("Failed to load OAuth token: %s", e)
+            return ""
+        _TOKEN_CACHE["key"] = key
+        _TOKEN_CACHE["token"] = token
+        return token
 
 
+@functools.lru_cache(maxsize=32)
 def get_asset_path(filename):
     """
     Helper function to get asset file paths.
@@ -93,6 +164,19 @@ def get_asset_path(filename):
     return ""
 
 
+_ICON_CACHE = {}
+
+
+def get_icon(path):
+    """
+    Returns a QIcon for the given asset path, built once and reused.
+    """
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        icon = _ICON_CACHE[path] = QIcon(path)
+    return icon
+
+
 class ApiTesterDialog(QDialog):
     """
     Simple dialog to send API requests and show/save responses.
@@ -100,12 +184,23 @@ class ApiTesterDialog(QDialog):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        _configure_logging()
 
         app = QApplication.instance()
         # Note: load_qss function not available, using default Qt styling
         if app:
             pass  # Could apply custom styling here if needed
 
+        self._full_result = None
+        self._last_raw_bytes = None
+        self._token = load_token()
+
+        # Qt performs the I/O asynchronously, pools connections, negotiates
+        # HTTP/2 and decompresses gzip responses itself.
+        self._nam = QNetworkAccessManager(self)
+        # Read here so a key from the lazily loaded .env still applies
+        self._api_key = (os.environ.get("BUNGIE_API_KEY") or BUNGIE_API_KEY).encode()
+
         self.setWindowTitle("Bungie API Tester")
         self.setMinimumWidth(800)
         self.setMinimumHeight(600)
@@ -144,16 +239,30 @@ class ApiTesterDialog(QDialog):
         status_label.setFont(status_font)
 
         # Connection status
-        token = load_token()
-        auth_status = QLabel(f"🔐 Auth: {'Connected' if token else 'API Key Only'}")
-        auth_status.setStyleSheet("color: #4caf50;" if token else "color: #ff9800;")
+        self.auth_status = QLabel()
+        self._update_auth_status()
 
         hero_layout.addWidget(status_label)
         hero_layout.addStretch()
-        hero_layout.addWidget(auth_status)
+        hero_layout.addWidget(self.auth_status)
 
         self.main_layout.addWidget(hero_frame)
 
+    def _update_auth_status(self):
+        """Reflect the cached token in the hero area's auth label."""
+        token = self._token
+        self.auth_status.setText(f"🔐 Auth: {'Connected' if token else 'API Key Only'}")
+        self.auth_status.setStyleSheet(
+            "color: #4caf50;" if token else "color: #ff9800;"
+        )
+
+    def refresh_token(self):
+        """
+        Re-reads the OAuth token from disk, e.g. after the user re-authenticates.
+        """
+        self._token = load_token()
+        self._update_auth_status()
+
     def create_request_card(self):
         """Create the request input card."""
         request_group = QGroupBox("API Request")
@@ -171,9 +280,10 @@ class ApiTesterDialog(QDialog):
         self.send_button = QPushButton("Send Request")
         send_icon_path = get_asset_path("send_icon.png")
         if send_icon_path:
-            self.send_button.setIcon(QIcon(send_icon_path))
+            self.send_button.setIcon(get_icon(send_icon_path))
         else:
             self.send_button.setText("🚀 Send Request")
+        self._send_label = self.send_button.text()
 
         endpoint_row.addWidget(endpoint_label)
         endpoint_row.addWidget(self.endpoint_input, 1)
@@ -188,14 +298,14 @@ class ApiTesterDialog(QDialog):
         results_group = QGroupBox("API Response")
         results_layout = QVBoxLayout()
 
-        self.result_view = QTextEdit()
+        self.result_view = QPlainTextEdit()
         self.result_view.setReadOnly(True)
         self.result_view.setPlaceholderText(
             "Response will appear here after sending a request..."
         )
         self.result_view.setStyleSheet(
             """
-            QTextEdit {
+            QPlainTextEdit {
                 border: 1px solid #ddd;
                 border-radius: 4px;
                 padding: 8px;
@@ -223,7 +333,7 @@ class ApiTesterDialog(QDialog):
         self.save_button = QPushButton("Save Result")
         save_icon_path = get_asset_path("save_icon.png")
         if save_icon_path:
-            self.save_button.setIcon(QIcon(save_icon_path))
+            self.save_button.setIcon(get_icon(save_icon_path))
         else:
             self.save_button.setText("💾 Save Result")
 
@@ -232,46 +342,115 @@ class ApiTesterDialog(QDialog):
 
     def make_request(self):
         """
-        Sends a GET request to the provided Bungie API endpoint and displays the result.
+        Sends a GET request to the provided Bungie API endpoint.
+        The response is displayed by _on_reply_finished once it arrives.
         """
+        # Whatever happens next, the previous response is no longer the one
+        # being shown, so Save must not write its bytes
+        self._last_raw_bytes = None
         endpoint = self.endpoint_input.text().strip()
-        if not endpoint.startswith("/"):
-            endpoint = "/" + endpoint
-        url = "https://www.bungie.net/Platform" + endpoint
-        headers = {"X-API-Key": BUNGIE_API_KEY}
-        token = load_token()
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        logging.info(f"Sending GET to {url} (auth: {'yes' if token else 'no'})")
+        url = urljoin(API_BASE_URL, endpoint.lstrip("/"))
+        # Never send the API key or token anywhere but the Bungie Platform
+        if not url.startswith(API_BASE_URL):
+            self.show_result(f"Error: {endpoint!r} is not a Bungie Platform endpoint")
+            return
+        logging.info(
+            "Sending GET to %s (auth: %s)", url, "yes" if self._token else "no"
+        )
 
         # Update UI to show loading state
         self.send_button.setText("🔄 Sending...")
         self.send_button.setEnabled(False)
 
+        self._send(endpoint, url, 0)
+
+    def _send(self, endpoint, url, attempt):
+        """Issue the GET for url; attempt counts retries already made."""
+        request = QNetworkRequest(QUrl(url))
+        request.setRawHeader(b"X-API-Key", self._api_key)
+        if self._token:
+            request.setRawHeader(b"Authorization", f"Bearer {self._token}".encode())
+        request.setAttribute(QNetworkRequest.Attribute.Http2AllowedAttribute, True)
+        request.setTransferTimeout(REQUEST_TIMEOUT_MS)
+
+        reply = self._nam.get(request)
+        reply.finished.connect(
+            lambda: self._on_reply_finished(reply, endpoint, url, attempt)
+        )
+
+    def _retry(self, endpoint, url, attempt):
+        """Resend after a backoff, unless the dialog was closed meanwhile."""
+        if not self.isVisible():
+            self.send_button.setText(self._send_label)
+            self.send_button.setEnabled(True)
+            return
+        self._send(endpoint, url, attempt)
+
+    def _on_reply_finished(self, reply, endpoint, url, attempt):
+        """Display a finished reply, or schedule a retry on gateway errors."""
+        reply.deleteLater()
+
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if status in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+            delay = RETRY_BACKOFF_MS * (2**attempt)
+            logging.info(
+                "API %s returned %s, retrying in %d ms", endpoint, status, delay
+            )
+            # Owned by the dialog, so closing it (which deletes it) cancels
+            # the pending retry
+            QTimer.singleShot(
+                delay, self, lambda: self._retry(endpoint, url, attempt + 1)
+            )
+            return
+
         try:
-            r = requests.get(url, headers=headers)
-            r.raise_for_status()
-            try:
-                data = r.json()
-                pretty = json.dumps(data, indent=2)
-            except Exception:
-                pretty = r.text
-            self.result_view.setPlainText(pretty)
-            logging.info(f"API {endpoint} success, {len(pretty)} chars.")
+            if reply.error() != QNetworkReply.NetworkError.NoError:
+                raise RuntimeError(reply.errorString())
+            body = reply.readAll().data()
+            pretty = None
+            # Only attempt a JSON parse when the server says the body is JSON
+            content_type = (
+                reply.header(QNetworkRequest.KnownHeaders.ContentTypeHeader) or ""
+            )
+            if content_type.startswith("application/json"):
+                try:
+                    pretty = pretty_json(body)
+                    # Kept so a .json save can write the body without re-encoding
+                    self._last_raw_bytes = body
+                except ValueError:
+                    pass
+            if pretty is None:
+                pretty = body.decode("utf-8", errors="replace")
+            self.show_result(pretty)
+            logging.info("API %s success, %d chars.", endpoint, len(pretty))
         except Exception as e:
             error_msg = f"Error: {e}"
-            self.result_view.setPlainText(error_msg)
-            logging.error(f"API {endpoint} error: {e}")
+            self.show_result(error_msg)
+            logging.error("API %s error: %s", endpoint, e)
         finally:
-            # Restore button state
-            send_icon_path = get_asset_path("send_icon.png")
-            if send_icon_path:
-                self.send_button.setIcon(QIcon(send_icon_path))
-                self.send_button.setText("Send Request")
-            else:
-                self.send_button.setText("🚀 Send Request")
+            # Restore button state; the icon set at construction is untouched
+            self.send_button.setText(self._send_label)
             self.send_button.setEnabled(True)
 
+    def show_result(self, text):
+        """
+        Displays text in the result view, truncating very large responses.
+        """
+        self._full_result = None
+        if len(text) > MAX_DISPLAY_CHARS:
+            self._full_result = text
+            text = (
+                text[:MAX_DISPLAY_CHARS] + "\n\n... response truncated for display; "
+                "use Save Result to write the full response."
+            )
+
+        # Suspend repaints so the view lays out the new text only once
+        self.result_view.setUpdatesEnabled(False)
+        try:
+            self.result_view.setPlainText(text)
+        finally:
+            self.result_view.setUpdatesEnabled(True)
+
     def save_result(self):
         """
         Saves the result view's contents to a file.
@@ -282,11 +461,26 @@ class ApiTesterDialog(QDialog):
             "api_result.json",
             "JSON Files (*.json);;Text Files (*.txt)",
         )
-        if fname:
-            try:
+        if not fname:
+            return
+        try:
+            if self._last_raw_bytes is not None and fname.endswith(".json"):
+                with open(fname, "wb", buffering=1 << 20) as f:
+                    f.write(self._last_raw_bytes)
+            else:
                 with open(fname, "w", encoding="utf-8") as f:
-                    f.write(self.result_view.toPlainText())
-                logging.info(f"Saved API result to {fname}")
-            except Exception as e:
-                self.result_view.append(f"\nSave error: {e}")
-                logging.error(f"Failed to save result: {e}")
+                    if self._full_result is not None:
+                        f.write(self._full_result)
+                    else:
+                        # Walk the document block by block rather than calling
+                        # toPlainText(), which copies the whole response at once.
+                        block = self.result_view.document().firstBlock()
+                        while block.isValid():
+                            f.write(block.text())
+                            block = block.next()
+                            if block.isValid():
+                                f.write("\n")
+            logging.info("Saved API result to %s", fname)
+        except Exception as e:
+            self.result_view.appendPlainText(f"\nSave error: {e}")
+            logging.error("Failed to save result: %s", e)
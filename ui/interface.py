@@ -5,13 +5,16 @@
 interface.py — Completely overhauled UI for RaidAssist with advanced features.
 """
 
+import concurrent.futures
 import csv
+import functools
+import itertools
 import json
 import logging
 import os
 import sys
 import time
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 # Enhanced error handling and logging
 try:
@@ -47,12 +50,18 @@ except ImportError:
 
 
 from PySide6.QtCore import (
+    QAbstractListModel,
     QEasingCurve,
+    QModelIndex,
     QPropertyAnimation,  # type: ignore
+    QObject,
+    QRunnable,
+    QSortFilterProxyModel,
     Qt,
-    QThread,
+    QThreadPool,
     QTimer,
     Signal,
+    Slot,
 )
 from PySide6.QtGui import QColor, QFont, QIcon, QPalette, QPixmap  # type: ignore
 
@@ -68,8 +77,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMenu,
     QMessageBox,
     QProgressBar,
@@ -89,31 +97,10 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-# Import application modules
-from api.bungie import (
-    ensure_authenticated,
-    fetch_profile,
-    load_cached_profile,
-    test_api_connection,
-)
-from api.manifest import get_item_info, load_item_definitions
-from api.parse_profile import (
-    extract_catalysts,
-    extract_exotics,
-    extract_red_borders,
-    load_profile,
-)
-from ui.api_tester import ApiTesterDialog
-from ui.loading import LoadingDialog
-from ui.settings import SettingsDialog, load_settings
-
-# Overlay system (name is fine; it's an import, not a UI class)
-try:
-    from ui.overlay import Overlay, create_overlay
-
-    OVERLAY_AVAILABLE = True
-except ImportError:
-    OVERLAY_AVAILABLE = False
+# Application modules (api.*, dialogs, overlay) are imported where they are
+# used, so the splash screen can paint before their import cost is paid.
+if TYPE_CHECKING:
+    from ui.overlay import Overlay
 
 # Hotkey support
 try:
@@ -123,24 +110,544 @@ try:
 except ImportError:
     HOTKEY_AVAILABLE = False
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+ASSETS_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assets")
+)
+
 
+@functools.lru_cache(maxsize=None)
 def get_asset_path(filename):
     """Get the full path to an asset file."""
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    assets_dir = os.path.join(base_dir, "..", "assets")
-    path = os.path.join(assets_dir, filename)
-    return os.path.normpath(path)
+    return os.path.normpath(os.path.join(ASSETS_DIR, filename))
+
+
+@functools.lru_cache(maxsize=8)
+def get_icon(filename) -> QIcon:
+    """
+    Get a QIcon for an asset file, decoded once and shared by every caller.
+    A missing file yields a null icon.
+    """
+    return QIcon(get_asset_path(filename))
+
+
+DARK_STYLESHEET = """
+    /* Main Window */
+    QWidget {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        font-family: 'Segoe UI', 'Roboto', Arial, sans-serif;
+        font-size: 10pt;
+    }
+    
+    /* Headers */
+    QLabel[heading="true"] {
+        font-size: 14pt;
+        font-weight: bold;
+        color: #00d4ff;
+        padding: 8px;
+    }
+    
+    /* Tabs */
+    QTabWidget::pane {
+        border: 2px solid #404040;
+        border-radius: 8px;
+        background-color: #2b2b2b;
+        padding: 4px;
+    }
+    
+    QTabBar::tab {
+        background-color: #404040;
+        color: #ffffff;
+        padding: 10px 20px;
+        margin: 2px;
+        border-radius: 6px;
+        min-width: 80px;
+    }
+    
+    QTabBar::tab:selected {
+        background-color: #00d4ff;
+        color: #000000;
+        font-weight: bold;
+    }
+    
+    QTabBar::tab:hover {
+        background-color: #0099cc;
+        color: #ffffff;
+    }
+    
+    /* Buttons */
+    QPushButton {
+        background-color: #404040;
+        border: 2px solid #00d4ff;
+        border-radius: 8px;
+        padding: 10px 20px;
+        font-weight: bold;
+        color: #ffffff;
+    }
+    
+    QPushButton:hover {
+        background-color: #00d4ff;
+        color: #000000;
+    }
+    
+    QPushButton:pressed {
+        background-color: #0080cc;
+        border-color: #0080cc;
+    }
+    
+    QPushButton:disabled {
+        background-color: #2b2b2b;
+        border-color: #666666;
+        color: #666666;
+    }
+    
+    /* Input Fields */
+    QLineEdit {
+        background-color: #333333;
+        border: 2px solid #666666;
+        border-radius: 6px;
+        padding: 8px 12px;
+        font-size: 10pt;
+    }
+    
+    QLineEdit:focus {
+        border-color: #00d4ff;
+        background-color: #404040;
+    }
+    
+    /* Lists */
+    QListView {
+        background-color: #2b2b2b;
+        border: 1px solid #666666;
+        border-radius: 6px;
+        alternate-background-color: #333333;
+        gridline-color: #404040;
+    }
+    
+    QListView::item {
+        padding: 8px;
+        border-bottom: 1px solid #404040;
+        border-radius: 3px;
+        margin: 1px;
+    }
+    
+    QListView::item:selected {
+        background-color: #00d4ff;
+        color: #000000;
+    }
+    
+    QListView::item:hover {
+        background-color: #404040;
+    }
+    
+    /* Progress Bars */
+    QProgressBar {
+        border: 2px solid #00d4ff;
+        border-radius: 8px;
+        text-align: center;
+        background-color: #333333;
+        color: #ffffff;
+        font-weight: bold;
+    }
+    
+    QProgressBar::chunk {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #00d4ff, stop:1 #0099cc);
+        border-radius: 6px;
+        margin: 2px;
+    }
+    
+    /* Status Bar */
+    QStatusBar {
+        background-color: #333333;
+        border-top: 1px solid #666666;
+        color: #ffffff;
+        font-size: 9pt;
+    }
+    
+    /* Frames */
+    QFrame[frameShape="4"] {
+        color: #666666;
+    }
+    
+    /* Checkboxes */
+    QCheckBox {
+        color: #ffffff;
+        spacing: 8px;
+    }
+    
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 2px solid #666666;
+        border-radius: 3px;
+        background-color: #333333;
+    }
+    
+    QCheckBox::indicator:checked {
+        background-color: #00d4ff;
+        border-color: #00d4ff;
+    }
+    
+    /* Sliders */
+    QSlider::groove:horizontal {
+        border: 1px solid #666666;
+        height: 6px;
+        background: #333333;
+        border-radius: 3px;
+    }
+    
+    QSlider::handle:horizontal {
+        background: #00d4ff;
+        border: 1px solid #0099cc;
+        width: 16px;
+        margin: -5px 0;
+        border-radius: 8px;
+    }
+    
+    QSlider::sub-page:horizontal {
+        background: #00d4ff;
+        border-radius: 3px;
+    }
+"""
+
+
+# Progress colors for the item lists, shared rather than built per row
+COLOR_DONE = QColor("#00ff00")
+COLOR_HALFWAY = QColor("#ffff00")
+COLOR_TODO = QColor("#ffffff")
+
+
+@functools.lru_cache(maxsize=4096)
+def build_tooltip(name, item_type, archetype, description) -> str:
+    """
+    Build the HTML tooltip for an item. Cached on its fields, so the same
+    item's tooltip is only formatted once across refreshes.
+    """
+    lines = []
+    if name:
+        lines.append(f"<b>{name}</b>")
+    if item_type:
+        lines.append(f"Type: {item_type}")
+    if archetype:
+        lines.append(f"Archetype: {archetype}")
+    if description:
+        lines.append(f"<i>{description}</i>")
+    return "<br>".join(lines)
+
+
+# Resolved item info by hash, for the item_defs it was resolved against.
+# Auto-refreshes resolve the same hashes every time, and load_item_definitions
+# returns the same dict until the manifest changes.
+_ITEM_INFO_CACHE = {"defs": None, "infos": {}}
+
+
+def process_items(
+    raw: List[Dict[str, Any]],
+    key_field: str,
+    item_defs: Dict[str, Any],
+    include_progress: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Resolve raw API items against the manifest into display dicts.
+
+    Args:
+        raw (list): Items from the profile extractors.
+        key_field (str): Field holding each item's manifest hash.
+        item_defs (dict): Destiny item definitions.
+        include_progress (bool): Copy progress/needed/percent from the raw
+            item; exotics have none and get a casefolded name instead.
+
+    Returns:
+        list: One display dict per raw item.
+    """
+    from api.manifest import get_item_info
+
+    if _ITEM_INFO_CACHE["defs"] is not item_defs:
+        _ITEM_INFO_CACHE["defs"] = item_defs
+        _ITEM_INFO_CACHE["infos"] = {}
+    known = _ITEM_INFO_CACHE["infos"]
+
+    infos = []
+    for item in raw:
+        item_hash = item.get(key_field, "")
+        info = known.get(item_hash)
+        if info is None:
+            info = known[item_hash] = get_item_info(item_hash, item_defs)
+        infos.append(info)
+
+    # get_item_info fills in every field, with placeholders for unknown
+    # hashes, so the fields are read directly
+    processed = [
+        {
+            "raw": item,
+            "name": info["name"],
+            "type": info["type"],
+            "icon": info["icon"],
+            "tooltip": build_tooltip(
+                info["name"], info["type"], info["archetype"], info["description"]
+            ),
+        }
+        for item, info in zip(raw, infos)
+    ]
+    if include_progress:
+        for entry in processed:
+            item = entry["raw"]
+            entry["progress"] = item.get("progress", 0)
+            entry["needed"] = item.get("needed", 1)
+            entry["percent"] = item.get("percent", 0)
+            # The list text only changes on refresh, so it is built here
+            # rather than each time the view asks for a row
+            entry["display"] = (
+                f"{entry['name']} - {entry['progress']}/{entry['needed']}"
+                f" ({entry['percent']}%)"
+            )
+    else:
+        # Folded once here so searching never re-folds names
+        for entry in processed:
+            entry["name_folded"] = entry["name"].casefold()
+    return processed
+
+
+def process_data(data: Dict[str, Any], item_defs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the display dicts for every item list in a refresh payload.
+
+    Args:
+        data (dict): Payload with raw "red_borders", "catalysts" and "exotics".
+        item_defs (dict): Destiny item definitions.
+
+    Returns:
+        dict: The same three keys, mapped to processed item lists, plus
+            "completed" with the red border and catalyst completion counts.
+    """
+    red_borders = process_items(
+        data.get("red_borders", []), "itemInstanceId", item_defs
+    )
+    catalysts = process_items(data.get("catalysts", []), "itemInstanceId", item_defs)
+    return {
+        "red_borders": red_borders,
+        "catalysts": catalysts,
+        "exotics": process_items(
+            data.get("exotics", []), "itemHash", item_defs, include_progress=False
+        ),
+        # Counted here, off the GUI thread, for the quick stats panel
+        "completed": {
+            "red_borders": sum(item["percent"] >= 100 for item in red_borders),
+            "catalysts": sum(item["percent"] >= 100 for item in catalysts),
+        },
+    }
+
+
+def profile_source_key() -> Optional[tuple]:
+    """
+    Get a cheap signature of the profile files a refresh reads from.
+
+    Returns:
+        tuple: (mtime_ns, size) per file, None for missing files, or None
+            when neither file exists.
+    """
+    from api.bungie import PROFILE_CACHE_PATH
+    from api.parse_profile import PROFILE_PATH
+
+    key = []
+    for path in (PROFILE_CACHE_PATH, PROFILE_PATH):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            key.append(None)
+        else:
+            key.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(key) if any(key) else None
+
+
+class ItemListModel(QAbstractListModel):
+    """
+    List model over processed red border or catalyst items. The view only
+    asks for the rows it paints, and searching is done by a
+    QSortFilterProxyModel on NameRole rather than by rebuilding widgets.
+    """
+
+    NameRole = Qt.ItemDataRole.UserRole + 1
+    PercentRole = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, default_color: Optional[QColor] = None, parent=None):
+        super().__init__(parent)
+        self._items: List[Dict[str, Any]] = []
+        self._default_color = default_color
+
+    @staticmethod
+    def _row_keys(items: List[Dict[str, Any]]) -> List[tuple]:
+        """
+        Identity key per row: the item instance id, else the item hash,
+        else the name. Repeats of a key are numbered so keys stay unique.
+        """
+        seen: Dict[Any, int] = {}
+        keys = []
+        for item in items:
+            raw = item["raw"]
+            key = raw.get("itemInstanceId") or raw.get("itemHash") or item["name"]
+            count = seen[key] = seen.get(key, 0) + 1
+            keys.append((key, count))
+        return keys
+
+    @staticmethod
+    def _runs(rows: List[int]) -> List[tuple]:
+        """Split ascending row numbers into (first, last) consecutive runs."""
+        runs = []
+        for row in rows:
+            if runs and runs[-1][1] == row - 1:
+                runs[-1] = (runs[-1][0], row)
+            else:
+                runs.append((row, row))
+        return runs
+
+    def set_items(self, items: List[Dict[str, Any]]):
+        """
+        Replace the model's rows with items. Old and new rows are matched by
+        item identity and only the differences are signalled: rows removed,
+        rows inserted, and rows whose text or tooltip changed. A refresh
+        therefore keeps the view's scroll position and selection instead of
+        resetting it.
+        """
+        old_keys = self._row_keys(self._items)
+        new_keys = self._row_keys(items)
+        old_rows = {key: row for row, key in enumerate(old_keys)}
+        new_rows = {key: row for row, key in enumerate(new_keys)}
+
+        rows = self._items = list(self._items)
+        keys = list(old_keys)
+
+        # Removals, back to front so earlier row numbers stay valid
+        removed = [row for row, key in enumerate(old_keys) if key not in new_rows]
+        for first, last in reversed(self._runs(removed)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del rows[first : last + 1]
+            del keys[first : last + 1]
+            self.endRemoveRows()
+
+        # Surviving rows that changed places are reordered in one layout
+        # change, carrying persistent indexes (selection) along with them
+        order = sorted(range(len(keys)), key=lambda row: new_rows[keys[row]])
+        if order != list(range(len(keys))):
+            self.layoutAboutToBeChanged.emit()
+            moved_to = {old: new for new, old in enumerate(order)}
+            persistent = self.persistentIndexList()
+            rows[:] = [rows[row] for row in order]
+            self.changePersistentIndexList(
+                persistent,
+                [self.index(moved_to[index.row()]) for index in persistent],
+            )
+            self.layoutChanged.emit()
+
+        # Insertions, front to back, so each run lands at its final row
+        added = [row for row, key in enumerate(new_keys) if key not in old_rows]
+        for first, last in self._runs(added):
+            self.beginInsertRows(QModelIndex(), first, last)
+            rows[first:first] = items[first : last + 1]
+            self.endInsertRows()
+
+        # Rows now line up with items; signal the ones whose text changed
+        changed = [
+            row
+            for row, (old, new) in enumerate(zip(rows, items))
+            if old["display"] != new["display"] or old["tooltip"] != new["tooltip"]
+        ]
+        self._items = items
+        for first, last in self._runs(changed):
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return item["display"]
+        if role == self.NameRole:
+            return item["name"]
+        if role == self.PercentRole:
+            return item["percent"]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return item["tooltip"]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            # Color coding based on progress
+            if item["percent"] >= 100:
+                return COLOR_DONE
+            if item["percent"] >= 50:
+                return COLOR_HALFWAY
+            return self._default_color
+        return None
+
+
+class ItemFilterProxyModel(QSortFilterProxyModel):
+    """
+    Name filter over an ItemListModel that can also hide completed items,
+    so toggling "Show Completed" re-filters in place instead of handing the
+    model a new list.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._show_completed = True
+
+    def set_show_completed(self, show: bool):
+        """Show or hide rows at 100% progress."""
+        if show == self._show_completed:
+            return
+        # Qt 6.9 replaced invalidateFilter with a begin/end pair
+        if hasattr(self, "beginFilterChange"):
+            self.beginFilterChange()
+            self._show_completed = show
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self._show_completed = show
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._show_completed:
+            index = self.sourceModel().index(source_row, 0, source_parent)
+            if index.data(ItemListModel.PercentRole) >= 100:
+                return False
+        return super().filterAcceptsRow(source_row, source_parent)
 
 
-class DataRefreshThread(QThread):
-    """Background thread for data refresh operations."""
+class DataRefreshSignals(QObject):
+    """Signals for DataRefreshJob, which as a QRunnable can't emit its own."""
 
     data_loaded = Signal(dict)
+    data_unchanged = Signal()
     error_occurred = Signal(str)
     progress_updated = Signal(int, str)
 
-    def __init__(self, membership_type=None, membership_id=None):
+
+class DataRefreshJob(QRunnable):
+    """Data refresh run on a pooled background thread."""
+
+    def __init__(
+        self,
+        signals,
+        item_defs=None,
+        membership_type=None,
+        membership_id=None,
+        last_source_key=None,
+    ):
         super().__init__()
+        self.signals = signals
+        # Only read while resolving item names, so it is shared, not copied
+        self.item_defs = item_defs or {}
+        # (profile_source_key(), expires_at) for the data already on screen;
+        # while the files match and the cache has not expired, the job
+        # reports no changes and stops after a single stat per file
+        self.last_source_key = last_source_key
         self.membership_type = membership_type
         self.membership_id = membership_id
         self.logger = get_logger("raidassist.data_thread")
@@ -148,44 +655,114 @@ class DataRefreshThread(QThread):
     def run(self):
         """Run the data refresh in background."""
         try:
+            from api.bungie import fetch_profile, load_cached_profile_entry
+            from api.parse_profile import (
+                extract_catalysts,
+                extract_exotics,
+                extract_red_borders,
+                load_profile,
+            )
+
             with log_context("background_data_refresh"):
-                self.progress_updated.emit(10, "Loading cached profile...")
+                self.signals.progress_updated.emit(10, "Loading cached profile...")
+
+                # Try cached data first. The cache expires by age without its
+                # file changing, so unchanged files only mean unchanged data
+                # until the expiry recorded when the cache was last read.
+                stat_key = profile_source_key()
+                if (
+                    stat_key is not None
+                    and self.last_source_key is not None
+                    and stat_key == self.last_source_key[0]
+                    and time.time() < self.last_source_key[1]
+                ):
+                    self.signals.progress_updated.emit(100, "No changes")
+                    self.signals.data_unchanged.emit()
+                    return
 
-                # Try cached data first
-                profile = load_cached_profile()
+                profile, expires_at = load_cached_profile_entry()
+                if not profile:
+                    # Without a fresh cache nothing expires: a stale cache
+                    # only changes when it is rewritten, which changes its stat
+                    expires_at = float("inf")
                 if not profile and self.membership_type and self.membership_id:
-                    self.progress_updated.emit(30, "Fetching fresh profile data...")
+                    self.signals.progress_updated.emit(
+                        30, "Fetching fresh profile data..."
+                    )
                     profile = fetch_profile(self.membership_type, self.membership_id)
                 elif not profile:
-                    self.progress_updated.emit(30, "Loading profile from disk...")
+                    self.signals.progress_updated.emit(
+                        30, "Loading profile from disk..."
+                    )
                     profile = load_profile()
 
                 if not profile:
-                    self.error_occurred.emit("No profile data available")
+                    self.signals.error_occurred.emit("No profile data available")
                     return
 
-                self.progress_updated.emit(50, "Processing red borders...")
-                red_borders = extract_red_borders(profile)
-
-                self.progress_updated.emit(70, "Processing catalysts...")
-                catalysts = extract_catalysts(profile)
-
-                self.progress_updated.emit(90, "Processing exotics...")
-                exotics = extract_exotics(profile)
+                self.signals.progress_updated.emit(50, "Processing profile data...")
 
-                data = {
-                    "red_borders": red_borders,
-                    "catalysts": catalysts,
-                    "exotics": exotics,
-                    "profile": profile,
+                # The extractors only read the profile, so run them side by
+                # side; extract_exotics also waits on the exotic cache file.
+                extractors = {
+                    "red_borders": extract_red_borders,
+                    "catalysts": extract_catalysts,
+                    "exotics": extract_exotics,
                 }
-
-                self.progress_updated.emit(100, "Data loaded successfully")
-                self.data_loaded.emit(data)
+                data = {"profile": profile}
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=len(extractors)
+                ) as executor:
+                    futures = {
+                        executor.submit(extract, profile): key
+                        for key, extract in extractors.items()
+                    }
+                    for done, future in enumerate(
+                        concurrent.futures.as_completed(futures), 1
+                    ):
+                        key = futures[future]
+                        data[key] = future.result()
+                        self.signals.progress_updated.emit(
+                            50 + 40 * done // len(extractors),
+                            f"Processed {key.replace('_', ' ')}...",
+                        )
+
+                # Resolve names and tooltips here too, so the GUI thread
+                # only has to hand the finished lists to its models
+                self.signals.progress_updated.emit(95, "Resolving item names...")
+                data["items"] = process_data(data, self.item_defs)
+                data["source_key"] = (stat_key, expires_at)
+
+                self.signals.progress_updated.emit(100, "Data loaded successfully")
+                self.signals.data_loaded.emit(data)
 
         except Exception as e:
             self.logger.error(f"Background data refresh failed: {e}")
-            self.error_occurred.emit(str(e))
+            self.signals.error_occurred.emit(str(e))
+
+
+class ConnectionCheckSignals(QObject):
+    """Signals for ConnectionCheckJob."""
+
+    status_checked = Signal(str)
+
+
+class ConnectionCheckJob(QRunnable):
+    """API connection test run on a pooled background thread."""
+
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        """Test the API connection and emit the resulting status."""
+        from api.bungie import test_api_connection
+
+        try:
+            status = "Connected" if test_api_connection() else "Disconnected"
+        except Exception:
+            status = "Error"
+        self.signals.status_checked.emit(status)
 
 
 class RaidAssistUI(QWidget):
@@ -197,6 +774,13 @@ class RaidAssistUI(QWidget):
     NO_DATA_MESSAGE = "No data available"
     NO_MATCHES_MESSAGE = "No matches found"
     LOADING_MESSAGE = "Loading..."
+    FILTER_DEBOUNCE_MS = 150
+
+    # Tab indices
+    TAB_RED_BORDERS = 0
+    TAB_CATALYSTS = 1
+    TAB_EXOTICS = 2
+    TAB_TOOLS = 3
 
     def __init__(self):
         super().__init__()
@@ -226,12 +810,16 @@ class RaidAssistUI(QWidget):
                 self._verify_prerequisites()
                 self._setup_data_structures()
                 self._setup_window()
+
+                # Load initial data while the widgets are built. Its results
+                # arrive as queued signals, which are only delivered once the
+                # event loop runs, after the UI below exists.
+                self._start_initial_data_load()
+
                 self._setup_ui_components()
                 self._setup_connections()
                 self._setup_background_services()
-
-                # Load initial data
-                self._start_initial_data_load()
+                self._show_refresh_in_progress()
 
                 self.logger.info("UI initialization completed successfully")
 
@@ -240,29 +828,29 @@ class RaidAssistUI(QWidget):
 
     def _show_splash_screen(self):
         """Show a professional splash screen during initialization."""
-        splash_pixmap = QPixmap(200, 200)
-        splash_pixmap.fill(QColor("#2b2b2b"))
+        # splash.png has the background, border and rounded corners baked in,
+        # so showing it is a single blit with no stylesheet to compile
+        splash_pixmap = QPixmap(get_asset_path("splash.png"))
+        if splash_pixmap.isNull():
+            splash_pixmap = QPixmap(200, 200)
+            splash_pixmap.fill(QColor("#2b2b2b"))
 
         self.splash = QSplashScreen(splash_pixmap)
-        self.splash.setStyleSheet(
-            """
-            QSplashScreen {
-                background-color: #2b2b2b;
-                border: 2px solid #00d4ff;
-                border-radius: 10px;
-            }
-        """
-        )
+        self.splash.show()
         self.splash.showMessage(
             "🎮 Initializing RaidAssist...",
             Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignBottom,
             QColor("#00d4ff"),
         )
-        self.splash.show()
+        # The blocking prerequisite checks run next on this thread, so give
+        # the window system one pass to map and expose the splash first.
+        # Later showMessage() calls repaint it directly once it is mapped.
         QApplication.processEvents()
 
     def _verify_prerequisites(self):
         """Verify all prerequisites are met."""
+        from api.bungie import ensure_authenticated, test_api_connection
+
         # Test API connectivity
         if not test_api_connection():
             raise RuntimeError("Cannot connect to Bungie API")
@@ -276,10 +864,11 @@ class RaidAssistUI(QWidget):
             Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignBottom,
             QColor("#00ff00"),
         )
-        QApplication.processEvents()
 
     def _setup_data_structures(self):
         """Initialize all data structures."""
+        from api.manifest import load_item_definitions
+
         # Item definitions
         self.item_defs = safe_execute(
             load_item_definitions, default_return={}, context=["manifest_loading"]
@@ -288,6 +877,14 @@ class RaidAssistUI(QWidget):
         # Data containers
         self._rb_items: List[Dict[str, Any]] = []
         self._cat_items: List[Dict[str, Any]] = []
+        self._completed_counts: Dict[str, int] = {"red_borders": 0, "catalysts": 0}
+        # The unprocessed lists from the last refresh, handed to the overlay
+        # as-is; nothing mutates them after they arrive
+        self._raw_data: Dict[str, List[Dict[str, Any]]] = {
+            "red_borders": [],
+            "catalysts": [],
+            "exotics": [],
+        }
         self._exotic_items: List[Dict[str, Any]] = []
 
         # State tracking
@@ -298,22 +895,25 @@ class RaidAssistUI(QWidget):
 
         # UI state
         self._is_refreshing = False
+        self._refresh_signals: Optional[DataRefreshSignals] = None
+        self._profile_source_key: Optional[tuple] = None
+        self._connection_signals: Optional[ConnectionCheckSignals] = None
         self._connection_status = "Unknown"
 
         # Overlay references
-        self.overlay_ref: Optional[Overlay] = None
+        self.overlay_ref: Optional["Overlay"] = None
+        self._overlay_signature: Optional[tuple] = None
 
         self.splash.showMessage(
             "📊 Data structures initialized...",
             Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignBottom,
             QColor("#00d4ff"),
         )
-        QApplication.processEvents()
 
     def _setup_window(self):
         """Setup the main window with enhanced appearance."""
         self.setWindowTitle("RaidAssist - Meta Progression Assistant")
-        self.setWindowIcon(QIcon(get_asset_path("raidassist_icon.png")))
+        self.setWindowIcon(get_icon("raidassist_icon.png"))
         self.setMinimumSize(900, 700)
         self.resize(1200, 800)
 
@@ -325,188 +925,14 @@ class RaidAssistUI(QWidget):
 
     def _apply_dark_theme(self):
         """Apply professional dark theme."""
-        self.setStyleSheet(
-            """
-            /* Main Window */
-            QWidget {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                font-family: 'Segoe UI', 'Roboto', Arial, sans-serif;
-                font-size: 10pt;
-            }
-            
-            /* Headers */
-            QLabel[heading="true"] {
-                font-size: 14pt;
-                font-weight: bold;
-                color: #00d4ff;
-                padding: 8px;
-            }
-            
-            /* Tabs */
-            QTabWidget::pane {
-                border: 2px solid #404040;
-                border-radius: 8px;
-                background-color: #2b2b2b;
-                padding: 4px;
-            }
-            
-            QTabBar::tab {
-                background-color: #404040;
-                color: #ffffff;
-                padding: 10px 20px;
-                margin: 2px;
-                border-radius: 6px;
-                min-width: 80px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #00d4ff;
-                color: #000000;
-                font-weight: bold;
-            }
-            
-            QTabBar::tab:hover {
-                background-color: #0099cc;
-                color: #ffffff;
-            }
-            
-            /* Buttons */
-            QPushButton {
-                background-color: #404040;
-                border: 2px solid #00d4ff;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-                color: #ffffff;
-            }
-            
-            QPushButton:hover {
-                background-color: #00d4ff;
-                color: #000000;
-            }
-            
-            QPushButton:pressed {
-                background-color: #0080cc;
-                border-color: #0080cc;
-            }
-            
-            QPushButton:disabled {
-                background-color: #2b2b2b;
-                border-color: #666666;
-                color: #666666;
-            }
-            
-            /* Input Fields */
-            QLineEdit {
-                background-color: #333333;
-                border: 2px solid #666666;
-                border-radius: 6px;
-                padding: 8px 12px;
-                font-size: 10pt;
-            }
-            
-            QLineEdit:focus {
-                border-color: #00d4ff;
-                background-color: #404040;
-            }
-            
-            /* Lists */
-            QListWidget {
-                background-color: #2b2b2b;
-                border: 1px solid #666666;
-                border-radius: 6px;
-                alternate-background-color: #333333;
-                gridline-color: #404040;
-            }
-            
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #404040;
-                border-radius: 3px;
-                margin: 1px;
-            }
-            
-            QListWidget::item:selected {
-                background-color: #00d4ff;
-                color: #000000;
-            }
-            
-            QListWidget::item:hover {
-                background-color: #404040;
-            }
-            
-            /* Progress Bars */
-            QProgressBar {
-                border: 2px solid #00d4ff;
-                border-radius: 8px;
-                text-align: center;
-                background-color: #333333;
-                color: #ffffff;
-                font-weight: bold;
-            }
-            
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #00d4ff, stop:1 #0099cc);
-                border-radius: 6px;
-                margin: 2px;
-            }
-            
-            /* Status Bar */
-            QStatusBar {
-                background-color: #333333;
-                border-top: 1px solid #666666;
-                color: #ffffff;
-                font-size: 9pt;
-            }
-            
-            /* Frames */
-            QFrame[frameShape="4"] {
-                color: #666666;
-            }
-            
-            /* Checkboxes */
-            QCheckBox {
-                color: #ffffff;
-                spacing: 8px;
-            }
-            
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-                border: 2px solid #666666;
-                border-radius: 3px;
-                background-color: #333333;
-            }
-            
-            QCheckBox::indicator:checked {
-                background-color: #00d4ff;
-                border-color: #00d4ff;
-            }
-            
-            /* Sliders */
-            QSlider::groove:horizontal {
-                border: 1px solid #666666;
-                height: 6px;
-                background: #333333;
-                border-radius: 3px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: #00d4ff;
-                border: 1px solid #0099cc;
-                width: 16px;
-                margin: -5px 0;
-                border-radius: 8px;
-            }
-            
-            QSlider::sub-page:horizontal {
-                background: #00d4ff;
-                border-radius: 3px;
-            }
-        """
-        )
+        # Set once on the application so Qt parses the rules a single time
+        # and every widget built afterwards (including lazily built tabs and
+        # dialogs) matches against the same compiled sheet.
+        app = QApplication.instance()
+        if app:
+            app.setStyleSheet(DARK_STYLESHEET)
+        else:
+            self.setStyleSheet(DARK_STYLESHEET)
 
     def _center_window(self):
         """Center the window on screen."""
@@ -534,7 +960,6 @@ class RaidAssistUI(QWidget):
             Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignBottom,
             QColor("#00d4ff"),
         )
-        QApplication.processEvents()
 
     def _setup_header(self):
         """Setup the application header."""
@@ -603,9 +1028,10 @@ class RaidAssistUI(QWidget):
         stats_layout.addWidget(stats_title)
 
         # Stats widgets
-        self.rb_summary = self._create_stat_widget("🔴 Red Borders", "0/0 (0%)")
-        self.cat_summary = self._create_stat_widget("⚡ Catalysts", "0/0 (0%)")
-        self.ex_summary = self._create_stat_widget("💎 Exotics", "0")
+        self._stat_labels: Dict[str, QLabel] = {}
+        self.rb_summary = self._create_stat_widget("rb", "🔴 Red Borders", "0/0 (0%)")
+        self.cat_summary = self._create_stat_widget("cat", "⚡ Catalysts", "0/0 (0%)")
+        self.ex_summary = self._create_stat_widget("ex", "💎 Exotics", "0")
 
         stats_layout.addWidget(self.rb_summary)
         stats_layout.addWidget(self.cat_summary)
@@ -649,8 +1075,8 @@ class RaidAssistUI(QWidget):
 
         parent.addWidget(stats_frame)
 
-    def _create_stat_widget(self, title: str, value: str) -> QFrame:
-        """Create a statistics display widget."""
+    def _create_stat_widget(self, key: str, title: str, value: str) -> QFrame:
+        """Create a statistics display widget, registering its value label."""
         widget = QFrame()
         widget.setFrameStyle(QFrame.Shape.StyledPanel)
         widget.setStyleSheet(
@@ -677,7 +1103,7 @@ class RaidAssistUI(QWidget):
         layout.addWidget(value_label)
 
         # Store reference to value label for updates
-        widget.value_label = value_label  # type: ignore[misc]
+        self._stat_labels[key] = value_label
 
         return widget
 
@@ -690,15 +1116,44 @@ class RaidAssistUI(QWidget):
         # Create tab widget
         self.tabs = QTabWidget()
 
-        # Setup tabs
-        self._setup_red_borders_tab()
-        self._setup_catalysts_tab()
-        self._setup_exotics_tab()
-        self._setup_tools_tab()
+        # Tabs start as empty containers; each one's contents are built the
+        # first time it is shown, so startup only pays for the visible tab
+        self._tab_builders = [
+            (self._setup_red_borders_tab, "🔴 Red Borders"),
+            (self._setup_catalysts_tab, "⚡ Catalysts"),
+            (self._setup_exotics_tab, "💎 Exotics"),
+            (self._setup_tools_tab, "🔧 Tools"),
+        ]
+        self._built_tabs = set()
+        for _builder, title in self._tab_builders:
+            container = QWidget()
+            QVBoxLayout(container).setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(container, title)
+
+        self._lazy_build_tab(self.tabs.currentIndex())
+        self.tabs.currentChanged.connect(self._lazy_build_tab)
 
         tabs_layout.addWidget(self.tabs)
         parent.addWidget(tabs_frame)
 
+    @Slot(int)
+    def _lazy_build_tab(self, index: int):
+        """Build the contents of the tab at index if it hasn't been built yet."""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+
+        builder, _title = self._tab_builders[index]
+        self.tabs.widget(index).layout().addWidget(builder())
+
+        # Fill the new tab with whatever data has already been loaded
+        if index == self.TAB_RED_BORDERS:
+            self._update_red_borders_display()
+        elif index == self.TAB_CATALYSTS:
+            self._update_catalysts_display()
+        elif index == self.TAB_EXOTICS:
+            self._update_exotics_display()
+
     def _setup_red_borders_tab(self):
         """Setup red borders tab."""
         tab_widget = QWidget()
@@ -724,7 +1179,11 @@ class RaidAssistUI(QWidget):
         layout.addWidget(search_frame)
 
         # List widget with features
-        self.red_border_list = QListWidget()
+        self._rb_model = ItemListModel(COLOR_TODO, self)
+        self._rb_proxy = self._create_filter_proxy(self._rb_model)
+        self.red_border_list = QListView()
+        self.red_border_list.setModel(self._rb_proxy)
+        self.red_border_list.setUniformItemSizes(True)
         self.red_border_list.setAlternatingRowColors(True)
         layout.addWidget(self.red_border_list)
 
@@ -733,7 +1192,13 @@ class RaidAssistUI(QWidget):
         self.rb_stats.setStyleSheet("color: #00d4ff; font-weight: bold;")
         layout.addWidget(self.rb_stats)
 
-        self.tabs.addTab(tab_widget, "🔴 Red Borders")
+        # Each keystroke restarts a short timer so a burst of typing filters
+        # the list once, when the user pauses
+        self._rb_filter_timer = self._create_filter_timer(self._filter_red_borders)
+        self.rb_search.textChanged.connect(self._rb_filter_timer.start)
+        self.rb_show_completed.toggled.connect(self._filter_red_borders)
+
+        return tab_widget
 
     def _setup_catalysts_tab(self):
         """Setup catalysts tab."""
@@ -760,7 +1225,11 @@ class RaidAssistUI(QWidget):
         layout.addWidget(search_frame)
 
         # List widget
-        self.catalyst_list = QListWidget()
+        self._cat_model = ItemListModel(parent=self)
+        self._cat_proxy = self._create_filter_proxy(self._cat_model)
+        self.catalyst_list = QListView()
+        self.catalyst_list.setModel(self._cat_proxy)
+        self.catalyst_list.setUniformItemSizes(True)
         self.catalyst_list.setAlternatingRowColors(True)
         layout.addWidget(self.catalyst_list)
 
@@ -769,7 +1238,11 @@ class RaidAssistUI(QWidget):
         self.cat_stats.setStyleSheet("color: #00d4ff; font-weight: bold;")
         layout.addWidget(self.cat_stats)
 
-        self.tabs.addTab(tab_widget, "⚡ Catalysts")
+        self._cat_filter_timer = self._create_filter_timer(self._filter_catalysts)
+        self.cat_search.textChanged.connect(self._cat_filter_timer.start)
+        self.cat_show_completed.toggled.connect(self._filter_catalysts)
+
+        return tab_widget
 
     def _setup_exotics_tab(self):
         """Setup exotics tab."""
@@ -793,7 +1266,10 @@ class RaidAssistUI(QWidget):
         self.ex_stats.setStyleSheet("color: #00d4ff; font-weight: bold;")
         layout.addWidget(self.ex_stats)
 
-        self.tabs.addTab(tab_widget, "💎 Exotics")
+        self._ex_filter_timer = self._create_filter_timer(self._filter_exotics)
+        self.ex_search.textChanged.connect(self._ex_filter_timer.start)
+
+        return tab_widget
 
     def _setup_tools_tab(self):
         """Setup tools and utilities tab."""
@@ -863,7 +1339,13 @@ class RaidAssistUI(QWidget):
         layout.addLayout(tools_grid)
         layout.addStretch()
 
-        self.tabs.addTab(tab_widget, "🔧 Tools")
+        self.export_json_btn.clicked.connect(lambda: self._export_data("json"))
+        self.export_csv_btn.clicked.connect(lambda: self._export_data("csv"))
+        self.api_tester_btn.clicked.connect(self._open_api_tester)
+        self.overlay_btn.clicked.connect(self._show_overlay)
+        self.settings_btn.clicked.connect(self.open_settings)
+
+        return tab_widget
 
     def _setup_footer(self):
         """Setup the application footer."""
@@ -882,10 +1364,7 @@ class RaidAssistUI(QWidget):
             self.logger.warning("System tray not available")
             return
 
-        tray_icon_path = get_asset_path("raidassist_icon.png")
-        tray_icon = QIcon(tray_icon_path) if os.path.exists(tray_icon_path) else QIcon()
-
-        self.tray_icon = QSystemTrayIcon(tray_icon, self)
+        self.tray_icon = QSystemTrayIcon(get_icon("raidassist_icon.png"), self)
         self.tray_icon.setToolTip("RaidAssist - Meta Progression Assistant")
 
         # Enhanced tray menu
@@ -916,35 +1395,31 @@ class RaidAssistUI(QWidget):
         self.overlay_button.clicked.connect(self._show_overlay)
         self.settings_button.clicked.connect(self.open_settings)
 
-        # Search connections
-        if hasattr(self, "rb_search"):
-            self.rb_search.textChanged.connect(self._filter_red_borders)
-        if hasattr(self, "cat_search"):
-            self.cat_search.textChanged.connect(self._filter_catalysts)
-        if hasattr(self, "ex_search"):
-            self.ex_search.textChanged.connect(self._filter_exotics)
-
-        # Filter connections
-        if hasattr(self, "rb_show_completed"):
-            self.rb_show_completed.toggled.connect(self._filter_red_borders)
-        if hasattr(self, "cat_show_completed"):
-            self.cat_show_completed.toggled.connect(self._filter_catalysts)
-
-        # Tools connections
-        if hasattr(self, "export_json_btn"):
-            self.export_json_btn.clicked.connect(lambda: self._export_data("json"))
-            self.export_csv_btn.clicked.connect(lambda: self._export_data("csv"))
-            self.api_tester_btn.clicked.connect(self._open_api_tester)
-
-            # Additional tools connections
-            self.overlay_btn.clicked.connect(self._show_overlay)
-            self.settings_btn.clicked.connect(self.open_settings)
+        # Tab contents are wired up by their builders in _setup_*_tab
+
+    def _create_filter_proxy(self, model: ItemListModel) -> ItemFilterProxyModel:
+        """Create a proxy that filters model by case-insensitive name match."""
+        proxy = ItemFilterProxyModel(self)
+        proxy.setSourceModel(model)
+        proxy.setFilterRole(ItemListModel.NameRole)
+        proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        return proxy
+
+    def _create_filter_timer(self, slot) -> QTimer:
+        """Create a single-shot timer that runs slot once typing pauses."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.FILTER_DEBOUNCE_MS)
+        timer.timeout.connect(slot)
+        return timer
 
     def _setup_background_services(self):
         """Setup background services and timers."""
         # Auto-refresh timer
         self.auto_refresh_timer = QTimer()
         self.auto_refresh_timer.timeout.connect(self._auto_refresh)
+        self._refresh_interval_ms: Optional[int] = None
+        self._settings_signals = None
 
         # Update refresh interval from settings
         self._update_refresh_interval()
@@ -993,10 +1468,9 @@ class RaidAssistUI(QWidget):
             Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignBottom,
             QColor("#00d4ff"),
         )
-        QApplication.processEvents()
 
-        # Start background refresh
-        self.refresh_data()
+        # Start background refresh; the widgets don't exist yet
+        self._start_refresh_job()
 
         # Hide splash screen
         QTimer.singleShot(1000, self._hide_splash)
@@ -1007,33 +1481,69 @@ class RaidAssistUI(QWidget):
             self.splash.close()
 
     # Data Management Methods
+    @Slot()
     def refresh_data(self):
         """Refresh all data with enhanced error handling."""
         if self._is_refreshing:
             self.logger.info("Refresh already in progress")
             return
 
-        self._is_refreshing = True
+        self._start_refresh_job()
+        self._show_refresh_in_progress()
+
+    def _show_refresh_in_progress(self):
+        """Reflect a running refresh in the refresh button and progress bar."""
+        if not self._is_refreshing:
+            return
         self.refresh_button.setEnabled(False)
         self.main_progress.setVisible(True)
         self.main_progress.setValue(0)
 
-        # Start background refresh
-        self.refresh_thread = DataRefreshThread()
-        self.refresh_thread.data_loaded.connect(self._on_data_loaded)
-        self.refresh_thread.error_occurred.connect(self._on_refresh_error)
-        self.refresh_thread.progress_updated.connect(self._on_refresh_progress)
-        self.refresh_thread.start()
+    def _start_refresh_job(self, skip_unchanged: bool = False):
+        """
+        Start the background refresh without touching any widgets. With
+        skip_unchanged, the job stops early if the profile on disk hasn't
+        changed since the data on screen was loaded.
+        """
+        self._is_refreshing = True
+
+        # One signals object is wired up once and shared by every job; the
+        # jobs themselves run on Qt's global pool, which reuses its threads
+        if self._refresh_signals is None:
+            self._refresh_signals = DataRefreshSignals(self)
+            self._refresh_signals.data_loaded.connect(self._on_data_loaded)
+            self._refresh_signals.data_unchanged.connect(self._on_data_unchanged)
+            self._refresh_signals.error_occurred.connect(self._on_refresh_error)
+            self._refresh_signals.progress_updated.connect(self._on_refresh_progress)
+        QThreadPool.globalInstance().start(
+            DataRefreshJob(
+                self._refresh_signals,
+                self.item_defs,
+                last_source_key=self._profile_source_key if skip_unchanged else None,
+            )
+        )
 
+    @Slot(dict)
     def _on_data_loaded(self, data: Dict[str, Any]):
         """Handle successful data loading."""
         try:
             with log_context("data_processing"):
-                self._rb_items = self._process_red_borders(data.get("red_borders", []))
-                self._cat_items = self._process_catalysts(data.get("catalysts", []))
-                self._exotic_items = self._process_exotics(data.get("exotics", []))
+                # Payloads from DataRefreshJob arrive already processed;
+                # the cached-data fallback still processes here
+                items = data.get("items") or process_data(data, self.item_defs)
+                self._rb_items = items["red_borders"]
+                self._cat_items = items["catalysts"]
+                self._completed_counts = items["completed"]
+                self._raw_data = {
+                    key: data.get(key, [])
+                    for key in ("red_borders", "catalysts", "exotics")
+                }
+                self._exotic_items = items["exotics"]
+                self._profile_source_key = data.get("source_key")
 
-                # Update UI
+                # Update UI. Painting is suspended so the stats labels, lists
+                # and status text are repainted together once, on re-enable.
+                self.setUpdatesEnabled(False)
                 self._update_all_displays()
                 self._update_overlay_data()
                 self._check_for_notifications()
@@ -1054,10 +1564,23 @@ class RaidAssistUI(QWidget):
             self._on_refresh_error(str(e))
 
         finally:
+            self.setUpdatesEnabled(True)
             self._is_refreshing = False
             self.refresh_button.setEnabled(True)
             self.main_progress.setVisible(False)
 
+    @Slot()
+    def _on_data_unchanged(self):
+        """Handle a refresh that found the profile unchanged."""
+        self._last_refresh_time = time.time()
+        self.refresh_status.setText(f"Last refresh: {time.strftime('%H:%M:%S')}")
+        self.status_label.setText("No changes since last refresh")
+
+        self._is_refreshing = False
+        self.refresh_button.setEnabled(True)
+        self.main_progress.setVisible(False)
+
+    @Slot(str)
     def _on_refresh_error(self, error_message: str):
         """Handle refresh errors."""
         self.logger.error(f"Data refresh failed: {error_message}")
@@ -1068,6 +1591,13 @@ class RaidAssistUI(QWidget):
 
         # Try to load cached data
         try:
+            from api.parse_profile import (
+                extract_catalysts,
+                extract_exotics,
+                extract_red_borders,
+                load_profile,
+            )
+
             profile = load_profile()
             if profile:
                 data = {
@@ -1085,241 +1615,136 @@ class RaidAssistUI(QWidget):
         self.refresh_button.setEnabled(True)
         self.main_progress.setVisible(False)
 
+    @Slot(int, str)
     def _on_refresh_progress(self, value: int, message: str):
         """Handle refresh progress updates."""
         self.main_progress.setValue(value)
         self.status_label.setText(message)
 
-    def _process_red_borders(
-        self, red_borders: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Process red border data for display."""
-        processed = []
-        for item in red_borders:
-            item_info = get_item_info(item.get("itemInstanceId", ""), self.item_defs)
-            processed.append(
-                {
-                    "raw": item,
-                    "name": item_info.get("name", "Unknown"),
-                    "type": item_info.get("type", "Unknown"),
-                    "progress": item.get("progress", 0),
-                    "needed": item.get("needed", 1),
-                    "percent": item.get("percent", 0),
-                    "icon": item_info.get("icon", ""),
-                    "tooltip": self._build_tooltip(item_info),
-                }
-            )
-        return processed
-
-    def _process_catalysts(
-        self, catalysts: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Process catalyst data for display."""
-        processed = []
-        for item in catalysts:
-            item_info = get_item_info(item.get("itemInstanceId", ""), self.item_defs)
-            processed.append(
-                {
-                    "raw": item,
-                    "name": item_info.get("name", "Unknown"),
-                    "type": item_info.get("type", "Unknown"),
-                    "progress": item.get("progress", 0),
-                    "needed": item.get("needed", 1),
-                    "percent": item.get("percent", 0),
-                    "icon": item_info.get("icon", ""),
-                    "tooltip": self._build_tooltip(item_info),
-                }
-            )
-        return processed
-
-    def _process_exotics(self, exotics: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process exotic data for display."""
-        processed = []
-        for item in exotics:
-            item_info = get_item_info(item.get("itemHash", ""), self.item_defs)
-            processed.append(
-                {
-                    "raw": item,
-                    "name": item_info.get("name", "Unknown"),
-                    "type": item_info.get("type", "Unknown"),
-                    "icon": item_info.get("icon", ""),
-                    "tooltip": self._build_tooltip(item_info),
-                }
-            )
-        return processed
-
-    def _build_tooltip(self, item_info: Dict[str, Any]) -> str:
-        """Build enhanced tooltip for items."""
-        lines = []
-        if item_info.get("name"):
-            lines.append(f"<b>{item_info['name']}</b>")
-        if item_info.get("type"):
-            lines.append(f"Type: {item_info['type']}")
-        if item_info.get("archetype"):
-            lines.append(f"Archetype: {item_info['archetype']}")
-        if item_info.get("description"):
-            lines.append(f"<i>{item_info['description']}</i>")
-        return "<br>".join(lines)
-
     # UI Update Methods
     def _update_all_displays(self):
         """Update all UI displays with current data."""
         self._update_stats_panel()
-        self._update_red_borders_display()
-        self._update_catalysts_display()
-        self._update_exotics_display()
+        # Tabs that haven't been built yet are filled when first shown
+        if self.TAB_RED_BORDERS in self._built_tabs:
+            self._update_red_borders_display()
+        if self.TAB_CATALYSTS in self._built_tabs:
+            self._update_catalysts_display()
+        if self.TAB_EXOTICS in self._built_tabs:
+            self._update_exotics_display()
 
     def _update_stats_panel(self):
         """Update the quick stats panel."""
         # Red borders stats
-        rb_completed = sum(1 for item in self._rb_items if item["percent"] >= 100)
+        rb_completed = self._completed_counts["red_borders"]
         rb_total = len(self._rb_items)
         rb_percent = int(100 * rb_completed / rb_total) if rb_total > 0 else 0
-        self.rb_summary.value_label.setText(  # type: ignore[misc]
-            f"{rb_completed}/{rb_total} ({rb_percent}%)"
-        )
+        self._stat_labels["rb"].setText(f"{rb_completed}/{rb_total} ({rb_percent}%)")
 
         # Catalysts stats
-        cat_completed = sum(1 for item in self._cat_items if item["percent"] >= 100)
+        cat_completed = self._completed_counts["catalysts"]
         cat_total = len(self._cat_items)
         cat_percent = int(100 * cat_completed / cat_total) if cat_total > 0 else 0
-        self.cat_summary.value_label.setText(  # type: ignore[misc]
+        self._stat_labels["cat"].setText(
             f"{cat_completed}/{cat_total} ({cat_percent}%)"
         )
 
         # Exotics stats
         ex_total = len(self._exotic_items)
-        self.ex_summary.value_label.setText(f"{ex_total}")  # type: ignore[misc]
+        self._stat_labels["ex"].setText(f"{ex_total}")
 
+    @Slot()
     def _update_red_borders_display(self):
         """Update red borders list display."""
-        self.red_border_list.clear()
-
-        for item in self._rb_items:
-            if not self._should_show_item(
-                item, self.rb_search.text(), self.rb_show_completed.isChecked()
-            ):
-                continue
-
-            list_item = QListWidgetItem()
-            list_item.setText(
-                f"{item['name']} - {item['progress']}/{item['needed']} ({item['percent']}%)"
-            )
-            list_item.setToolTip(item["tooltip"])
-
-            # Color coding based on progress
-            if item["percent"] >= 100:
-                list_item.setData(Qt.ItemDataRole.ForegroundRole, QColor("#00ff00"))
-            elif item["percent"] >= 50:
-                list_item.setData(Qt.ItemDataRole.ForegroundRole, QColor("#ffff00"))
-            else:
-                list_item.setData(Qt.ItemDataRole.ForegroundRole, QColor("#ffffff"))
-
-            self.red_border_list.addItem(list_item)
-
-        # Update stats
-        displayed = self.red_border_list.count()
-        total = len(self._rb_items)
-        self.rb_stats.setText(f"Showing {displayed} of {total} red border weapons")
+        self._rb_model.set_items(self._rb_items)
+        self._filter_red_borders()
 
+    @Slot()
     def _update_catalysts_display(self):
         """Update catalysts list display."""
-        self.catalyst_list.clear()
-
-        for item in self._cat_items:
-            if not self._should_show_item(
-                item, self.cat_search.text(), self.cat_show_completed.isChecked()
-            ):
-                continue
-
-            list_item = QListWidgetItem()
-            list_item.setText(
-                f"{item['name']} - {item['progress']}/{item['needed']} ({item['percent']}%)"
-            )
-            list_item.setToolTip(item["tooltip"])
-
-            # Color coding
-            if item["percent"] >= 100:
-                list_item.setData(Qt.ItemDataRole.ForegroundRole, QColor("#00ff00"))
-            elif item["percent"] >= 50:
-                list_item.setData(Qt.ItemDataRole.ForegroundRole, QColor("#ffff00"))
-
-            self.catalyst_list.addItem(list_item)
-
-        # Update stats
-        displayed = self.catalyst_list.count()
-        total = len(self._cat_items)
-        self.cat_stats.setText(f"Showing {displayed} of {total} catalysts")
+        self._cat_model.set_items(self._cat_items)
+        self._filter_catalysts()
 
     def _update_exotics_display(self):
         """Update exotics tree display."""
-        self.exotic_tree.clear()
-
-        # Group by type
-        categories = {}
-        for item in self._exotic_items:
-            item_type = item["type"] or "Unknown"
-            if item_type not in categories:
-                categories[item_type] = []
-            categories[item_type].append(item)
-
-        # Add to tree
-        for category, items in categories.items():
-            category_item = QTreeWidgetItem([category, "", ""])
-            category_item.setExpanded(True)
+        # With no search text every exotic is shown, so skip the name test
+        needle = self.ex_search.text().casefold()
+        if needle:
+            exotics = [
+                item for item in self._exotic_items if needle in item["name_folded"]
+            ]
+        else:
+            exotics = self._exotic_items
 
-            for item in items:
-                if not self._should_show_exotic(item, self.ex_search.text()):
-                    continue
+        # Group by type; the sort is stable, so items keep their order
+        def type_key(item):
+            return item["type"] or "Unknown"
 
+        # Build the whole tree detached, then insert it in one call
+        top_items = []
+        for category, items in itertools.groupby(
+            sorted(exotics, key=type_key), key=type_key
+        ):
+            children = []
+            for item in items:
                 child_item = QTreeWidgetItem([item["name"], item["type"], "Collection"])
                 child_item.setToolTip(0, item["tooltip"])
-                category_item.addChild(child_item)
+                children.append(child_item)
+
+            category_item = QTreeWidgetItem([category, "", ""])
+            category_item.setExpanded(True)
+            category_item.addChildren(children)
+            top_items.append(category_item)
 
-            if category_item.childCount() > 0:
-                self.exotic_tree.addTopLevelItem(category_item)
+        sorting = self.exotic_tree.isSortingEnabled()
+        self.exotic_tree.setUpdatesEnabled(False)
+        self.exotic_tree.setSortingEnabled(False)
+        try:
+            self.exotic_tree.clear()
+            self.exotic_tree.addTopLevelItems(top_items)
+        finally:
+            self.exotic_tree.setSortingEnabled(sorting)
+            self.exotic_tree.setUpdatesEnabled(True)
 
         # Update stats
         total = len(self._exotic_items)
         self.ex_stats.setText(f"Collection: {total} exotics")
 
-    def _should_show_item(
-        self, item: Dict[str, Any], search_text: str, show_completed: bool
-    ) -> bool:
-        """Determine if item should be shown based on filters."""
-        # Search filter
-        if search_text and search_text.lower() not in item["name"].lower():
-            return False
-
-        # Completion filter
-        if not show_completed and item["percent"] >= 100:
-            return False
-
-        return True
-
-    def _should_show_exotic(self, item: Dict[str, Any], search_text: str) -> bool:
-        """Determine if exotic should be shown based on search."""
-        if search_text and search_text.lower() not in item["name"].lower():
-            return False
-        return True
-
     # Filter Methods
+    @Slot()
     def _filter_red_borders(self):
         """Apply filters to red borders display."""
-        self._update_red_borders_display()
+        self._rb_proxy.set_show_completed(self.rb_show_completed.isChecked())
+        self._rb_proxy.setFilterFixedString(self.rb_search.text())
+
+        # Update stats
+        displayed = self._rb_proxy.rowCount()
+        total = len(self._rb_items)
+        self.rb_stats.setText(f"Showing {displayed} of {total} red border weapons")
 
+    @Slot()
     def _filter_catalysts(self):
         """Apply filters to catalysts display."""
-        self._update_catalysts_display()
+        self._cat_proxy.set_show_completed(self.cat_show_completed.isChecked())
+        self._cat_proxy.setFilterFixedString(self.cat_search.text())
+
+        # Update stats
+        displayed = self._cat_proxy.rowCount()
+        total = len(self._cat_items)
+        self.cat_stats.setText(f"Showing {displayed} of {total} catalysts")
 
+    @Slot()
     def _filter_exotics(self):
         """Apply filters to exotics display."""
         self._update_exotics_display()
 
     # Overlay Methods
+    @Slot()
     def _show_overlay(self):
         """Show the overlay system."""
-        if not OVERLAY_AVAILABLE:
+        try:
+            from ui.overlay import create_overlay
+        except ImportError:
             QMessageBox.warning(
                 self,
                 "Overlay Unavailable",
@@ -1340,19 +1765,13 @@ class RaidAssistUI(QWidget):
                     getattr(self.overlay_ref, "activateWindow", lambda: None)()
                 return
 
-            # Prepare data for overlay
-            overlay_data = {
-                "red_borders": [item["raw"] for item in self._rb_items],
-                "catalysts": [item["raw"] for item in self._cat_items],
-                "exotics": [item["raw"] for item in self._exotic_items],
-            }
-
             self.overlay_ref = create_overlay(None)
             if self.overlay_ref:
                 if hasattr(self.overlay_ref, "update_data"):
                     getattr(self.overlay_ref, "update_data", lambda x: None)(
-                        overlay_data
+                        self._raw_data
                     )
+                    self._overlay_signature = self._overlay_data_signature()
                 if hasattr(self.overlay_ref, "show"):
                     getattr(self.overlay_ref, "show", lambda: None)()
                 self.logger.info("Overlay opened successfully")
@@ -1372,9 +1791,19 @@ class RaidAssistUI(QWidget):
         ):
             if hasattr(self.overlay_ref, "close"):
                 getattr(self.overlay_ref, "close", lambda: None)()
+            # Whatever was last sent is gone with the window
+            self._overlay_signature = None
         else:
             self._show_overlay()
 
+    def _overlay_data_signature(self) -> tuple:
+        """Get a per-item key of the progress last sent to the overlay."""
+        return (
+            tuple((item["name"], item["percent"]) for item in self._rb_items),
+            tuple((item["name"], item["percent"]) for item in self._cat_items),
+            tuple(item["name"] for item in self._exotic_items),
+        )
+
     def _update_overlay_data(self):
         """Update overlay with current data."""
         if (
@@ -1382,42 +1811,60 @@ class RaidAssistUI(QWidget):
             and hasattr(self.overlay_ref, "isVisible")
             and getattr(self.overlay_ref, "isVisible", lambda: False)()
         ):
-            overlay_data = {
-                "red_borders": [item["raw"] for item in self._rb_items],
-                "catalysts": [item["raw"] for item in self._cat_items],
-                "exotics": [item["raw"] for item in self._exotic_items],
-            }
+            # Most auto-refreshes bring back the same progress; skip the
+            # overlay update (and its widget redraws) when nothing moved
+            signature = self._overlay_data_signature()
+            if signature == self._overlay_signature:
+                return
+            self._overlay_signature = signature
+
             if hasattr(self.overlay_ref, "update_data"):
-                getattr(self.overlay_ref, "update_data", lambda x: None)(overlay_data)
+                getattr(self.overlay_ref, "update_data", lambda x: None)(self._raw_data)
 
     # Utility Methods
+    @Slot()
     def _check_connection(self):
         """Check API connection status."""
-
-        def check_in_background():
-            try:
-                if test_api_connection():
-                    self._connection_status = "Connected"
-                    self.connection_indicator.setText("🟢")
-                else:
-                    self._connection_status = "Disconnected"
-                    self.connection_indicator.setText("🔴")
-            except:
-                self._connection_status = "Error"
-                self.connection_indicator.setText("🔴")
-
-        # Run in background to avoid blocking UI
-        QTimer.singleShot(0, check_in_background)
-
+        # The test makes a network request, so it runs on the thread pool
+        # and only the indicator update comes back to the GUI thread
+        if self._connection_signals is None:
+            self._connection_signals = ConnectionCheckSignals(self)
+            self._connection_signals.status_checked.connect(self._on_connection_checked)
+        QThreadPool.globalInstance().start(ConnectionCheckJob(self._connection_signals))
+
+    @Slot(str)
+    def _on_connection_checked(self, status: str):
+        """Show the result of a connection check."""
+        self._connection_status = status
+        self.connection_indicator.setText("🟢" if status == "Connected" else "🔴")
+
+    @Slot()
     def _auto_refresh(self):
         """Perform automatic refresh."""
+        # Unlike the refresh button, timed refreshes skip reloading a
+        # profile that hasn't changed on disk
         if not self._is_refreshing:
-            self.refresh_data()
+            self._start_refresh_job(skip_unchanged=True)
+            self._show_refresh_in_progress()
 
     def _update_refresh_interval(self):
-        """Update auto-refresh interval from settings."""
-        settings = load_settings()
+        """Update auto-refresh interval from settings loaded off the GUI thread."""
+        from ui.settings import SettingsLoadJob, SettingsLoadSignals
+
+        if self._settings_signals is None:
+            self._settings_signals = SettingsLoadSignals(self)
+            self._settings_signals.settings_loaded.connect(self._apply_refresh_interval)
+        QThreadPool.globalInstance().start(SettingsLoadJob(self._settings_signals))
+
+    @Slot(dict)
+    def _apply_refresh_interval(self, settings: dict):
+        """Apply the auto-refresh interval from a settings dictionary."""
         interval = settings.get("refresh_interval_seconds", 300) * 1000  # Convert to ms
+        # Restarting the timer resets its countdown, so an unchanged interval
+        # must leave it running or saving settings would postpone refreshes
+        if interval == self._refresh_interval_ms:
+            return
+        self._refresh_interval_ms = interval
         self.auto_refresh_timer.start(interval)
 
     def _check_for_notifications(self):
@@ -1431,13 +1878,13 @@ class RaidAssistUI(QWidget):
         try:
             current_tab = self.tabs.currentIndex()
             if current_tab == 0:  # Red Borders
-                data = [item["raw"] for item in self._rb_items]
+                items = self._rb_items
                 filename = f"red_borders.{format_type}"
             elif current_tab == 1:  # Catalysts
-                data = [item["raw"] for item in self._cat_items]
+                items = self._cat_items
                 filename = f"catalysts.{format_type}"
             elif current_tab == 2:  # Exotics
-                data = [item["raw"] for item in self._exotic_items]
+                items = self._exotic_items
                 filename = f"exotics.{format_type}"
             else:
                 return
@@ -1451,11 +1898,28 @@ class RaidAssistUI(QWidget):
 
             if file_path:
                 if format_type == "json":
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        json.dump(data, f, indent=2)
+                    data = [item["raw"] for item in items]
+                    if orjson is not None:
+                        with open(file_path, "wb", buffering=1 << 20) as f:
+                            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                    else:
+                        with open(
+                            file_path, "w", encoding="utf-8", buffering=1 << 20
+                        ) as f:
+                            json.dump(data, f, indent=2)
                 elif format_type == "csv":
-                    # CSV export logic would go here
-                    pass
+                    # Rows are generated as they are written, so memory use
+                    # doesn't grow with the number of items
+                    columns = ["name", "type", "progress", "needed", "percent"]
+                    with open(
+                        file_path, "w", encoding="utf-8", newline="", buffering=1 << 20
+                    ) as f:
+                        writer = csv.writer(f)
+                        writer.writerow(columns)
+                        writer.writerows(
+                            [item.get(column, "") for column in columns]
+                            for item in items
+                        )
 
                 QMessageBox.information(
                     self, "Export Successful", f"Data exported to {file_path}"
@@ -1465,35 +1929,49 @@ class RaidAssistUI(QWidget):
             self.logger.error(f"Export failed: {e}")
             QMessageBox.warning(self, "Export Failed", f"Failed to export data:\n{e}")
 
+    @Slot()
     def _open_api_tester(self):
         """Open the API tester dialog."""
         try:
+            from ui.api_tester import ApiTesterDialog
+
+            # Modeless, so the main window stays usable while it is open;
+            # the parent keeps it alive until it is closed
             dialog = ApiTesterDialog(self)
-            dialog.exec_()
+            dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+            dialog.show()
         except Exception as e:
             self.logger.error(f"Failed to open API tester: {e}")
 
+    @Slot()
     def open_settings(self):
         """Open settings dialog."""
         try:
+            from ui.settings import SettingsDialog
+
             dialog = SettingsDialog(self)
             if dialog.exec_():
-                self._update_refresh_interval()
+                # The dialog saves in the background, so use its values
+                # rather than reading back a file that may not be written yet
+                self._apply_refresh_interval(dialog.settings)
         except Exception as e:
             self.logger.error(f"Failed to open settings: {e}")
 
     # System tray handlers
+    @Slot(QSystemTrayIcon.ActivationReason)
     def _on_tray_activated(self, reason):
         """Handle system tray activation."""
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             self._show_dashboard()
 
+    @Slot()
     def _show_dashboard(self):
         """Show the main dashboard."""
         self.showNormal()
         self.raise_()
         self.activateWindow()
 
+    @Slot()
     def _show_quick_stats(self):
         """Show quick stats notification."""
         if hasattr(self, "tray_icon"):
@@ -1524,6 +2002,7 @@ class RaidAssistUI(QWidget):
         else:
             event.accept()
 
+    @Slot()
     def _quit_application(self):
         """Quit the application properly."""
         app = QApplication.instance()
@@ -2,10 +2,11 @@
 loading.py — Simple loading modal dialog for RaidAssist.
 """
 
+import functools
 import os
 
 from PySide6.QtCore import Qt  # type: ignore
-from PySide6.QtGui import QIcon, QPixmap  # type: ignore
+from PySide6.QtGui import QPixmap  # type: ignore
 from PySide6.QtWidgets import (
     QDialog,
     QFrame,
@@ -20,6 +21,23 @@ def get_asset_path(filename):
     return os.path.join(os.path.dirname(__file__), "..", "assets", filename)
 
 
+@functools.lru_cache(maxsize=1)
+def get_loading_pixmap():
+    """
+    Get the 32x32 loading icon, read and scaled once for every dialog.
+    Returns a null pixmap if the icon file is missing.
+    """
+    pixmap = QPixmap(get_asset_path("loading_icon.png"))
+    if pixmap.isNull():
+        return pixmap
+    return pixmap.scaled(
+        32,
+        32,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
+
 class LoadingDialog(QDialog):
     """
     Displays a modal loading window with a customizable message using modern card design.
@@ -61,10 +79,10 @@ class LoadingDialog(QDialog):
 
         # Loading icon
         icon_label = QLabel()
-        try:
-            icon_pixmap = QIcon(get_asset_path("loading_icon.png")).pixmap(32, 32)
+        icon_pixmap = get_loading_pixmap()
+        if not icon_pixmap.isNull():
             icon_label.setPixmap(icon_pixmap)
-        except:
+        else:
             # Fallback text if icon not found
             icon_label.setText("⏳")
             icon_label.setStyleSheet("font-size: 24px;")
@@ -13,6 +13,7 @@ Features:
 - Performance optimized for gaming
 """
 
+import functools
 import json
 import math
 import os
@@ -27,58 +28,29 @@ QT_AVAILABLE = False
 try:
     from PySide6.QtCore import (
         QEasingCurve,
-        QMutex,
-        QObject,  # type: ignore
-        QPoint,
-        QPropertyAnimation,
+        QPropertyAnimation,  # type: ignore
         QRect,
-        QSize,
         Qt,
-        QThread,
         QTimer,
+        QVariantAnimation,
         Signal,
-        Slot,
     )
     from PySide6.QtGui import (
-        QBrush,
         QColor,
         QFont,  # type: ignore
         QFontMetrics,
-        QIcon,
-        QLinearGradient,
         QMouseEvent,
         QPainter,
-        QPainterPath,
         QPaintEvent,
         QPen,
         QPixmap,
-        QRadialGradient,
-        QAction,
     )
     from PySide6.QtWidgets import (
-        QApplication,  # type: ignore
-        QCheckBox,
-        QColorDialog,
-        QComboBox,
-        QFontDialog,
-        QFrame,
-        QGraphicsDropShadowEffect,
-        QGraphicsEffect,
-        QGridLayout,
-        QGroupBox,
-        QHBoxLayout,
-        QLabel,
-        QMenu,
-        QProgressBar,
-        QPushButton,
-        QScrollArea,
-        QSizePolicy,
-        QSlider,
-        QSpinBox,
-        QStackedWidget,
-        QSystemTrayIcon,
+        QGraphicsOpacityEffect,
+        QStyle,
+        QStyleOption,
         QVBoxLayout,
-        QWidget,
+        QWidget,  # type: ignore
     )
 
     QT_AVAILABLE = True
@@ -86,6 +58,11 @@ except ImportError:
     # Create placeholder classes when Qt is not available
     pass
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 from utils.error_handler import safe_execute
 
 # Always import these for type definitions
@@ -190,6 +167,104 @@ class OverlayConfig:
                 WidgetType.NOTIFICATION.value,
             ]
 
+    def __setattr__(self, name: str, value: Any):
+        # Any field change invalidates the serialized form kept by _dump()
+        object.__setattr__(self, "_dumped", None)
+        object.__setattr__(self, name, value)
+
+    def _dump(self) -> bytes:
+        """Serialize the config for saving, reusing the last result if unchanged."""
+        # The widget dict and list can change in place without __setattr__,
+        # so the cached bytes are only reused while they still match
+        dumped = self.__dict__.get("_dumped")
+        if (
+            dumped is not None
+            and dumped[1] == self.widgets_enabled
+            and dumped[2] == self.widget_order
+        ):
+            return dumped[0]
+
+        data = asdict(self)
+        if orjson is not None:
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            raw = json.dumps(data, indent=2).encode("utf-8")
+        object.__setattr__(
+            self,
+            "_dumped",
+            (raw, dict(self.widgets_enabled), list(self.widget_order)),
+        )
+        return raw
+
+
+OVERLAY_THEMES = {
+    "dark": {
+        "background": "#1a1a1a",
+        "text": "#ffffff",
+        "accent": "#00d4ff",
+        "border": "#333333",
+    },
+    "light": {
+        "background": "#f0f0f0",
+        "text": "#000000",
+        "accent": "#0066cc",
+        "border": "#cccccc",
+    },
+    "destiny": {
+        "background": "#0d1421",
+        "text": "#f1c40f",
+        "accent": "#e74c3c",
+        "border": "#34495e",
+    },
+}
+
+# Overlay window stylesheet per theme, formatted once at import
+THEME_STYLESHEETS = {
+    name: f"""
+                QWidget {{
+                    background-color: {theme['background']};
+                    color: {theme['text']};
+                    border: 2px solid {theme['border']};
+                    border-radius: 10px;
+                }}
+            """
+    for name, theme in OVERLAY_THEMES.items()
+}
+
+
+@functools.lru_cache(maxsize=32)
+def widget_stylesheet(
+    background_color: str,
+    text_color: str,
+    font_family: str,
+    font_size: int,
+    accent_color: str,
+) -> str:
+    """
+    Build the stylesheet for an overlay widget. Widgets sharing a config
+    share one string instead of each formatting their own.
+
+    Args:
+        background_color (str): Widget background color.
+        text_color (str): Text color.
+        font_family (str): Font family name.
+        font_size (int): Font size in pixels.
+        accent_color (str): Border color.
+
+    Returns:
+        str: Qt stylesheet.
+    """
+    return f"""
+                QWidget {{
+                    background-color: {background_color};
+                    color: {text_color};
+                    font-family: {font_family};
+                    font-size: {font_size}px;
+                    border-radius: 8px;
+                    border: 1px solid {accent_color};
+                }}
+            """
+
 
 # Only define Qt-dependent classes when Qt is available
 if QT_AVAILABLE:
@@ -204,6 +279,8 @@ if QT_AVAILABLE:
             self.logger = get_logger("raidassist.overlay")
             self.last_update = 0
             self.data = {}
+            # Set when data arrives while hidden; redrawn on the next show
+            self._display_stale = False
 
             self.setMinimumSize(200, 40)
             self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
@@ -218,74 +295,106 @@ if QT_AVAILABLE:
         def _setup_styling(self):
             """Setup basic widget styling."""
             self.setStyleSheet(
-                f"""
-                QWidget {{
-                    background-color: {self.config.background_color};
-                    color: {self.config.text_color};
-                    font-family: {self.config.font_family};
-                    font-size: {self.config.font_size}px;
-                    border-radius: 8px;
-                    border: 1px solid {self.config.accent_color};
-                }}
-            """
+                widget_stylesheet(
+                    self.config.background_color,
+                    self.config.text_color,
+                    self.config.font_family,
+                    self.config.font_size,
+                    self.config.accent_color,
+                )
             )
 
         def _setup_animations(self):
             """Setup animations for the widget."""
-            self.fade_animation = QPropertyAnimation(self, b"windowOpacity")
+            # windowOpacity only applies to top-level windows, and these are
+            # children of the overlay, so fade through an opacity effect
+            self._opacity_effect = QGraphicsOpacityEffect(self)
+            self._opacity_effect.setEnabled(False)
+            self.setGraphicsEffect(self._opacity_effect)
+            self.fade_animation = QPropertyAnimation(self._opacity_effect, b"opacity")
             self.fade_animation.setDuration(self.config.fade_duration)
             self.fade_animation.setEasingCurve(QEasingCurve.Type.InOutQuad)
+            self.fade_animation.finished.connect(self._on_fade_finished)
+
+        def _on_fade_finished(self):
+            """
+            Drop the effect once the fade ends so normal paints skip it. The
+            fade only runs between 0 and 1; the overlay's overall
+            transparency comes from the window's own opacity.
+            """
+            if self._opacity_effect.opacity() <= 0.0:
+                # Faded out and hidden: reset so showing the widget again
+                # without fade_in() does not leave it blank
+                self._opacity_effect.setOpacity(1.0)
+            if self._opacity_effect.opacity() >= 1.0:
+                self._opacity_effect.setEnabled(False)
 
         def fade_in(self):
-            """Animate widget fade in."""
-            if hasattr(self, "fade_animation"):
-                self.fade_animation.setStartValue(0.0)
-                self.fade_animation.setEndValue(self.config.opacity)
-                self.fade_animation.start()
+            """Animate widget fade in. Only valid with animations enabled."""
+            self._opacity_effect.setEnabled(True)
+            self.fade_animation.setStartValue(0.0)
+            self.fade_animation.setEndValue(1.0)
+            self.fade_animation.start()
 
         def fade_out(self):
-            """Animate widget fade out."""
-            if hasattr(self, "fade_animation"):
-                self.fade_animation.setStartValue(self.config.opacity)
-                self.fade_animation.setEndValue(0.0)
-                self.fade_animation.start()
+            """Animate widget fade out. Only valid with animations enabled."""
+            self._opacity_effect.setEnabled(True)
+            self.fade_animation.setStartValue(1.0)
+            self.fade_animation.setEndValue(0.0)
+            self.fade_animation.start()
 
-        def update_data(self, data: Dict[str, Any]):
-            """Update widget with new data."""
+        def update_data(self, data: Dict[str, Any], ts: Optional[float] = None):
+            """
+            Update widget with new data. ts is the time.monotonic() stamp of
+            the batch, shared by every widget updated together.
+            """
             self.data = data
-            self.last_update = time.time()
+            self.last_update = ts if ts is not None else time.monotonic()
+            if not self.isVisible():
+                self._display_stale = True
+                return
             self.update_display()
 
+        def showEvent(self, event):
+            """Catch up on data that arrived while the widget was hidden."""
+            super().showEvent(event)
+            if self._display_stale:
+                self._display_stale = False
+                self.update_display()
+
         def update_display(self):
             """Update the visual display - override in subclasses."""
             pass
 
     class ProgressOverlayWidget(BaseOverlayWidget):
-        """Widget for displaying progress bars for various activities."""
+        """
+        Widget for displaying progress bars for various activities. The
+        title, labels and bars are all drawn in one paintEvent instead of
+        as a QLabel and QProgressBar per item.
+        """
+
+        MARGIN = 10
+        ROW_SPACING = 8
+        BAR_HEIGHT = 8
 
         def __init__(self, config: OverlayConfig):
             super().__init__(WidgetType.PROGRESS_BAR, config)
-            self.progress_bars = {}
-            self.progress_labels = {}
-            self._setup_ui()
+            self.title = "Progress Overview"
+            self.progress_items: Dict[str, Dict[str, Any]] = {}
+            # Background, title and empty bar tracks, which only change with
+            # the widget's size, style or rows; labels and fills go on top
+            self._static_layer: Optional[QPixmap] = None
+
+            # One animation drives every bar: it runs from 0 to 1 and each
+            # moving bar is interpolated between its own start and end
+            self._bar_moves: Dict[str, Tuple[float, float]] = {}
+            self._animation = QVariantAnimation(self)
+            self._animation.setDuration(500)
+            self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self._animation.setStartValue(0.0)
+            self._animation.setEndValue(1.0)
+            self._animation.valueChanged.connect(self._step_bars)
 
-        def _setup_ui(self):
-            """Setup the progress widget UI."""
-            layout = QVBoxLayout(self)
-            layout.setContentsMargins(10, 10, 10, 10)
-            layout.setSpacing(8)
-
-            # Title
-            self.title_label = QLabel("Progress Overview")
-            self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.title_label.setStyleSheet("font-weight: bold; font-size: 12px;")
-            layout.addWidget(self.title_label)
-
-            # Progress container
-            self.progress_container = QVBoxLayout()
-            layout.addLayout(self.progress_container)
-
-            # Initialize default progress items
             self._setup_default_progress_items()
 
         def _setup_default_progress_items(self):
@@ -298,40 +407,49 @@ if QT_AVAILABLE:
                 ("Season Pass", "#90e0ef"),
             ]
 
-            for name, color in progress_items:
-                self._add_progress_item(name, color)
+            self._add_progress_items(progress_items)
 
         def _add_progress_item(self, name: str, color: str):
             """Add a progress tracking item."""
-            # Label
-            label = QLabel(f"{name}: 0/0 (0%)")
-            label.setStyleSheet(f"color: {color}; font-weight: bold;")
-            self.progress_labels[name] = label
-
-            # Progress bar
-            progress_bar = QProgressBar()
-            progress_bar.setMaximum(100)
-            progress_bar.setValue(0)
-            progress_bar.setTextVisible(False)
-            progress_bar.setFixedHeight(8)
-            progress_bar.setStyleSheet(
-                f"""
-                QProgressBar {{
-                    border: 1px solid #555;
-                    border-radius: 4px;
-                    background-color: #333;
-                }}
-                QProgressBar::chunk {{
-                    background-color: {color};
-                    border-radius: 3px;
-                }}
-            """
+            self._add_progress_items([(name, color)])
+
+        def _add_progress_items(self, items: List[Tuple[str, str]]):
+            """Add progress tracking items, resizing the widget once for all."""
+            for name, color in items:
+                self.progress_items[name] = {
+                    "color": QColor(color),
+                    "text": f"{name}: 0/0 (0%)",
+                    "value": 0.0,
+                }
+            self._static_layer = None
+            self.setMinimumHeight(self._content_height())
+            self.update()
+
+        def _fonts(self) -> Tuple[QFont, QFont]:
+            """Return the title and label fonts, derived from the widget font."""
+            title_font = QFont(self.font())
+            title_font.setBold(True)
+            title_font.setPixelSize(12)
+            label_font = QFont(self.font())
+            label_font.setBold(True)
+            return title_font, label_font
+
+        def _content_height(self) -> int:
+            """Height needed to draw the title and every item."""
+            title_font, label_font = self._fonts()
+            title_height = QFontMetrics(title_font).height()
+            row_height = (
+                QFontMetrics(label_font).height()
+                + 2
+                + self.BAR_HEIGHT
+                + self.ROW_SPACING
+            )
+            return (
+                2 * self.MARGIN
+                + title_height
+                + self.ROW_SPACING
+                + row_height * len(self.progress_items)
             )
-            self.progress_bars[name] = progress_bar
-
-            # Add to layout
-            self.progress_container.addWidget(label)
-            self.progress_container.addWidget(progress_bar)
 
         def update_display(self):
             """Update progress bars with current data."""
@@ -340,42 +458,153 @@ if QT_AVAILABLE:
 
             # Update each progress item
             progress_data = self.data.get("progress", {})
-            for name, progress_bar in self.progress_bars.items():
+            targets = {}
+            text_changed = False
+            for name, item in self.progress_items.items():
                 if name in progress_data:
                     data = progress_data[name]
                     current = data.get("current", 0)
                     total = data.get("total", 1)
-                    percentage = int((current / total) * 100) if total > 0 else 0
+                    # Integer math: no float round trip, and 29/100 stays 29%
+                    percentage = int(current * 100 // total) if total > 0 else 0
 
-                    # Update progress bar
-                    self._animate_progress_change(progress_bar, percentage)
+                    text = f"{name}: {current}/{total} ({percentage}%)"
+                    if text != item["text"]:
+                        item["text"] = text
+                        text_changed = True
+                    targets[name] = percentage
 
-                    # Update label
-                    label = self.progress_labels[name]
-                    label.setText(f"{name}: {current}/{total} ({percentage}%)")
+            # Repaint only for visible changes; moving bars repaint as they
+            # animate, and unchanged data leaves the widget alone
+            if self._animate_progress_changes(targets) or text_changed:
+                self.update()
 
-        def _animate_progress_change(
-            self, progress_bar: QProgressBar, target_value: int
-        ):
-            """Animate progress bar value changes."""
-            if not self.config.enable_animations:
-                progress_bar.setValue(target_value)
-                return
-
-            current_value = progress_bar.value()
-            if current_value == target_value:
-                return
+        def _animate_progress_changes(self, targets: Dict[str, int]) -> bool:
+            """
+            Animate progress bars towards their new values. Returns whether
+            any bar was set directly and needs a repaint.
+            """
+            moves = {
+                name: (self.progress_items[name]["value"], float(target_value))
+                for name, target_value in targets.items()
+                if self.progress_items[name]["value"] != target_value
+            }
+            if not moves:
+                return False
 
-            # Create animation for smooth progress updates
-            animation = QPropertyAnimation(progress_bar, b"value")
-            animation.setDuration(500)
-            animation.setStartValue(current_value)
-            animation.setEndValue(target_value)
-            animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            # Bars still moving restart from wherever they got to
+            self._animation.stop()
+            if not self.config.enable_animations:
+                self._bar_moves = {}
+                for name, (_, end) in moves.items():
+                    self.progress_items[name]["value"] = end
+                return True
+
+            self._bar_moves = moves
+            self._animation.start()
+            return False
+
+        def _step_bars(self, progress):
+            """Move every animating bar to progress (0-1) of its way."""
+            for name, (start, end) in self._bar_moves.items():
+                self.progress_items[name]["value"] = start + (end - start) * progress
+            self.update()
+
+        def _layout_rows(self) -> Tuple[QRect, List[Tuple[QRect, QRect]]]:
+            """Return the title rect and a (label, bar) rect pair per item."""
+            title_font, label_font = self._fonts()
+            area = self.rect().adjusted(
+                self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN
+            )
+            y = area.top()
+
+            line_height = QFontMetrics(title_font).height()
+            title_rect = QRect(area.left(), y, area.width(), line_height)
+            y += line_height + self.ROW_SPACING
+
+            rows = []
+            line_height = QFontMetrics(label_font).height()
+            for _ in self.progress_items:
+                label_rect = QRect(area.left(), y, area.width(), line_height)
+                y += line_height + 2
+                rows.append(
+                    (label_rect, QRect(area.left(), y, area.width(), self.BAR_HEIGHT))
+                )
+                y += self.BAR_HEIGHT + self.ROW_SPACING
+            return title_rect, rows
+
+        def _render_static_layer(self, rows: List[Tuple[QRect, QRect]], title_rect):
+            """Render the background, title and empty bar tracks to a pixmap."""
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+            # Background and border still come from the stylesheet
+            option = QStyleOption()
+            option.initFrom(self)
+            self.style().drawPrimitive(
+                QStyle.PrimitiveElement.PE_Widget, option, painter, self
+            )
 
-            # Store animation to prevent garbage collection
-            progress_bar._animation = animation  # type: ignore[misc]
-            animation.start()
+            painter.setFont(self._fonts()[0])
+            painter.setPen(QColor(self.config.text_color))
+            painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, self.title)
+
+            painter.setPen(QPen(QColor("#555555"), 1))
+            painter.setBrush(QColor("#333333"))
+            for _, bar in rows:
+                painter.drawRoundedRect(bar, 4, 4)
+
+            painter.end()
+            return pixmap
+
+        def resizeEvent(self, event):
+            """Re-render the static layer at the new size."""
+            self._static_layer = None
+            super().resizeEvent(event)
+
+        def changeEvent(self, event):
+            """Re-render the static layer when the style or font changes."""
+            self._static_layer = None
+            super().changeEvent(event)
+
+        def paintEvent(self, event: QPaintEvent):
+            """Draw the title and each item's label and bar."""
+            title_rect, rows = self._layout_rows()
+            if self._static_layer is None:
+                self._static_layer = self._render_static_layer(rows, title_rect)
+
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.drawPixmap(0, 0, self._static_layer)
+
+            painter.setFont(self._fonts()[1])
+            for item, (label_rect, bar) in zip(self.progress_items.values(), rows):
+                painter.setPen(item["color"])
+                painter.drawText(
+                    label_rect,
+                    Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                    item["text"],
+                )
+
+                filled = int(bar.width() * item["value"] / 100)
+                if filled > 0:
+                    painter.setPen(Qt.PenStyle.NoPen)
+                    painter.setBrush(item["color"])
+                    painter.drawRoundedRect(
+                        QRect(bar.left(), bar.top(), filled, bar.height()), 3, 3
+                    )
+
+            painter.end()
+
+    # Widget class for each WidgetType value that the overlay can create
+    WIDGET_FACTORIES = {
+        WidgetType.PROGRESS_BAR.value: ProgressOverlayWidget,
+    }
 
     class Overlay(QWidget):  # type: ignore
         """Main overlay window with multiple widgets."""
@@ -386,13 +615,27 @@ if QT_AVAILABLE:
         widget_removed = Signal(str)
         config_changed = Signal(dict)
 
+        # Data pushed within this window is merged and applied in one pass
+        UPDATE_COALESCE_MS = 50
+
         def __init__(self, config: Optional[OverlayConfig] = None):
             super().__init__()
             self.config = config or OverlayConfig()
             self.logger = get_logger("raidassist.overlay.main")
             self.widgets = {}
+            # Widgets with fade animations, collected as they are added;
+            # empty when animations are disabled
+            self._animatable: List[BaseOverlayWidget] = []
             self.data_cache = {}
 
+            self._pending_data = {}
+            # Values last handed to the widgets, to drop repeats of them
+            self._dispatched_data: Dict[str, Any] = {}
+            self._flush_timer = QTimer(self)
+            self._flush_timer.setSingleShot(True)
+            self._flush_timer.setInterval(self.UPDATE_COALESCE_MS)
+            self._flush_timer.timeout.connect(self._flush_data)
+
             # Setup window properties
             self._setup_window()
 
@@ -444,38 +687,8 @@ if QT_AVAILABLE:
 
         def _apply_theme(self):
             """Apply the selected theme to the overlay."""
-            themes = {
-                "dark": {
-                    "background": "#1a1a1a",
-                    "text": "#ffffff",
-                    "accent": "#00d4ff",
-                    "border": "#333333",
-                },
-                "light": {
-                    "background": "#f0f0f0",
-                    "text": "#000000",
-                    "accent": "#0066cc",
-                    "border": "#cccccc",
-                },
-                "destiny": {
-                    "background": "#0d1421",
-                    "text": "#f1c40f",
-                    "accent": "#e74c3c",
-                    "border": "#34495e",
-                },
-            }
-
-            theme = themes.get(self.config.theme, themes["dark"])
-
             self.setStyleSheet(
-                f"""
-                QWidget {{
-                    background-color: {theme['background']};
-                    color: {theme['text']};
-                    border: 2px solid {theme['border']};
-                    border-radius: 10px;
-                }}
-            """
+                THEME_STYLESHEETS.get(self.config.theme, THEME_STYLESHEETS["dark"])
             )
 
         def _create_enabled_widgets(self):
@@ -486,12 +699,17 @@ if QT_AVAILABLE:
 
         def _add_widget(self, widget_type: str):
             """Add a widget to the overlay."""
+            factory = WIDGET_FACTORIES.get(widget_type)
+            if factory is None:
+                return
+
             try:
-                if widget_type == WidgetType.PROGRESS_BAR.value:
-                    widget = ProgressOverlayWidget(self.config)
-                    self.widgets[widget_type] = widget
-                    self.main_layout.addWidget(widget)
-                    self.widget_added.emit(widget_type)
+                widget = factory(self.config)
+                self.widgets[widget_type] = widget
+                if self.config.enable_animations:
+                    self._animatable.append(widget)
+                self.main_layout.addWidget(widget)
+                self.widget_added.emit(widget_type)
 
                 self.logger.debug(f"Added widget: {widget_type}")
 
@@ -499,11 +717,32 @@ if QT_AVAILABLE:
                 self.logger.error(f"Failed to add widget {widget_type}: {e}")
 
         def update_data(self, data: Dict[str, Any]):
-            """Update all widgets with new data."""
+            """
+            Update all widgets with new data. Widgets are updated shortly
+            after, once per burst of calls, with the merged data.
+            """
             self.data_cache.update(data)
+            self._pending_data.update(data)
+            if not self._flush_timer.isActive():
+                self._flush_timer.start()
+
+        def _flush_data(self):
+            """Apply the data merged since the last flush to every widget."""
+            data, self._pending_data = self._pending_data, {}
+            if not data:
+                return
 
+            # Data identical to what the widgets already show changes nothing
+            if all(
+                key in self._dispatched_data and self._dispatched_data[key] == value
+                for key, value in data.items()
+            ):
+                return
+            self._dispatched_data.update(data)
+
+            ts = time.monotonic()
             for widget in self.widgets.values():
-                safe_execute(widget.update_data, data, default_return=None)
+                safe_execute(widget.update_data, data, ts, default_return=None)
 
             self.data_updated.emit(data)
 
@@ -515,17 +754,21 @@ if QT_AVAILABLE:
         def show_overlay(self):
             """Show the overlay with animations if enabled."""
             self.show()
+            if hasattr(self, "refresh_timer"):
+                self.refresh_timer.start(self.config.refresh_interval)
             if self.config.enable_animations:
-                for widget in self.widgets.values():
-                    if hasattr(widget, "fade_in"):
-                        widget.fade_in()
+                for widget in self._animatable:
+                    widget.fade_in()
 
         def hide_overlay(self):
             """Hide the overlay with animations if enabled."""
+            # Nothing is drawn while hidden, so there is nothing to refresh
+            if hasattr(self, "refresh_timer"):
+                self.refresh_timer.stop()
+
             if self.config.enable_animations:
-                for widget in self.widgets.values():
-                    if hasattr(widget, "fade_out"):
-                        widget.fade_out()
+                for widget in self._animatable:
+                    widget.fade_out()
 
             # Hide after animation completes
             QTimer.singleShot(self.config.fade_duration, self.hide)
@@ -533,6 +776,15 @@ if QT_AVAILABLE:
         def mousePressEvent(self, event: QMouseEvent):
             """Handle mouse press for dragging."""
             if self.config.draggable and event.button() == Qt.MouseButton.LeftButton:
+                # Let the window manager drag the window where it can, so no
+                # move events have to be handled here
+                window = self.windowHandle()
+                if window is not None and window.startSystemMove():
+                    if hasattr(self, "drag_position"):
+                        del self.drag_position
+                    event.accept()
+                    return
+
                 self.drag_position = event.globalPos() - self.frameGeometry().topLeft()
                 event.accept()
 
@@ -579,9 +831,13 @@ def load_overlay_config(config_path: str) -> OverlayConfig:
     """Load overlay configuration from file."""
     try:
         if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                data = json.load(f)
-                return OverlayConfig(**data)
+            if orjson is not None:
+                with open(config_path, "rb") as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(config_path, "r") as f:
+                    data = json.load(f)
+            return OverlayConfig(**data)
     except Exception as e:
         logger = get_logger("raidassist.overlay")
         logger.error(f"Failed to load overlay config: {e}")
@@ -589,12 +845,32 @@ def load_overlay_config(config_path: str) -> OverlayConfig:
     return OverlayConfig()
 
 
+# Bytes last written to each path and the file's stat right after, so
+# saving an unchanged config over an untouched file is a no-op
+_SAVED_CONFIG_CACHE: Dict[str, Tuple[bytes, Tuple[int, int]]] = {}
+
+
+def _config_file_stat(config_path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(config_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
 def save_overlay_config(config: OverlayConfig, config_path: str):
     """Save overlay configuration to file."""
     try:
+        raw = config._dump()
+        if _SAVED_CONFIG_CACHE.get(config_path) == (
+            raw,
+            _config_file_stat(config_path),
+        ):
+            return
         os.makedirs(os.path.dirname(config_path), exist_ok=True)
-        with open(config_path, "w") as f:
-            json.dump(asdict(config), f, indent=2)
+        with open(config_path, "wb") as f:
+            f.write(raw)
+        _SAVED_CONFIG_CACHE[config_path] = (raw, _config_file_stat(config_path))
     except Exception as e:
         logger = get_logger("raidassist.overlay")
         logger.error(f"Failed to save overlay config: {e}")
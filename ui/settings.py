@@ -4,11 +4,13 @@ settings.py — Settings dialog and config loader for RaidAssist.
 Stores and loads app preferences in JSON.
 """
 
+import functools
 import json
 import logging
 import os
+import threading
 
-from PySide6.QtCore import Qt  # type: ignore
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal  # type: ignore
 from PySide6.QtGui import QFont, QIcon  # type: ignore
 from PySide6.QtWidgets import (
     QDialog,
@@ -21,6 +23,11 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 
 def get_project_root():
     """Returns the absolute path to the project root."""
@@ -32,37 +39,96 @@ def get_asset_path(filename):
     return os.path.join(get_project_root(), "RaidAssist", "assets", filename)
 
 
+@functools.lru_cache(maxsize=None)
+def load_icon(filename):
+    """
+    Loads an asset icon once and reuses it for later dialogs.
+    Args:
+        filename (str): Asset file name.
+    Returns:
+        QIcon or None: The icon, or None if the asset is missing.
+    """
+    path = get_asset_path(filename)
+    return QIcon(path) if os.path.exists(path) else None
+
+
 SETTINGS_PATH = os.path.join(
     get_project_root(), "RaidAssist", "config", "settings.json"
 )
 LOG_PATH = os.path.join(get_project_root(), "RaidAssist", "logs", "settings.log")
 
-os.makedirs(os.path.dirname(SETTINGS_PATH), exist_ok=True)
-os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+logger = logging.getLogger(__name__)
+_dirs_ensured = False
+# Settings are loaded and saved from pool threads, which may overlap
+_dirs_lock = threading.Lock()
+
+# Last settings read or written, keyed by file path and mtime
+_SETTINGS_CACHE = {"key": None, "data": None}
+# Settings queued by SettingsSaveJob but not yet written. Loads return
+# these so a load can't overtake a save still waiting in the pool
+_PENDING_SAVE = {"data": None}
+_cache_lock = threading.Lock()
 
-logging.basicConfig(
-    filename=LOG_PATH,
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-)
+
+def _ensure_dirs():
+    """
+    Creates the settings and log directories and attaches the settings log
+    file on first use, rather than at import.
+    """
+    global _dirs_ensured
+    if _dirs_ensured:
+        return
+    with _dirs_lock:
+        if _dirs_ensured:
+            return
+        os.makedirs(os.path.dirname(SETTINGS_PATH), exist_ok=True)
+        os.makedirs(os.path.dirname(LOG_PATH), exist_ok=True)
+
+        handler = logging.FileHandler(LOG_PATH, encoding="utf-8")
+        handler.setFormatter(
+            logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+        )
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        _dirs_ensured = True
 
 
 def load_settings():
     """
-    Loads app settings from disk.
+    Loads app settings from disk, or from memory if the file hasn't changed
+    since it was last read or written.
     Returns:
-        dict: Settings dictionary.
+        dict: Settings dictionary. Callers get their own copy.
     """
-    if os.path.exists(SETTINGS_PATH):
-        try:
+    _ensure_dirs()
+    with _cache_lock:
+        if _PENDING_SAVE["data"] is not None:
+            return dict(_PENDING_SAVE["data"])
+
+    try:
+        key = (SETTINGS_PATH, os.stat(SETTINGS_PATH).st_mtime_ns)
+    except OSError:
+        logger.warning("Settings file does not exist.")
+        return {"refresh_interval_seconds": 60}
+
+    with _cache_lock:
+        if _SETTINGS_CACHE["key"] == key:
+            return dict(_SETTINGS_CACHE["data"])
+
+    try:
+        if orjson is not None:
+            with open(SETTINGS_PATH, "rb") as f:
+                settings = orjson.loads(f.read())
+        else:
             with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
                 settings = json.load(f)
-                logging.info("Settings loaded.")
-                return settings
-        except Exception as e:
-            logging.error(f"Failed to load settings: {e}")
-    else:
-        logging.warning("Settings file does not exist.")
+        with _cache_lock:
+            _SETTINGS_CACHE["key"] = key
+            _SETTINGS_CACHE["data"] = dict(settings)
+        logger.info("Settings loaded.")
+        return settings
+    except Exception as e:
+        logger.error(f"Failed to load settings: {e}")
     return {"refresh_interval_seconds": 60}
 
 
@@ -74,16 +140,62 @@ def save_settings(settings):
     Returns:
         bool: True if successful, False otherwise.
     """
+    _ensure_dirs()
     try:
-        with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
-        logging.info("Settings saved.")
+        if orjson is not None:
+            with open(SETTINGS_PATH, "wb") as f:
+                f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+        else:
+            with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
+                json.dump(settings, f, indent=2)
+        key = (SETTINGS_PATH, os.stat(SETTINGS_PATH).st_mtime_ns)
+        with _cache_lock:
+            _SETTINGS_CACHE["key"] = key
+            _SETTINGS_CACHE["data"] = dict(settings)
+        logger.info("Settings saved.")
         return True
     except Exception as e:
-        logging.error(f"Failed to save settings: {e}")
+        logger.error(f"Failed to save settings: {e}")
         return False
 
 
+class SettingsLoadSignals(QObject):
+    """Signals for SettingsLoadJob."""
+
+    settings_loaded = Signal(dict)
+
+
+class SettingsLoadJob(QRunnable):
+    """Settings load run on a pooled background thread."""
+
+    def __init__(self, signals):
+        super().__init__()
+        self.signals = signals
+
+    def run(self):
+        """Load settings from disk and emit them."""
+        self.signals.settings_loaded.emit(load_settings())
+
+
+class SettingsSaveJob(QRunnable):
+    """Settings save run on a pooled background thread."""
+
+    def __init__(self, settings):
+        super().__init__()
+        # Snapshot so later edits on the GUI thread can't race the write
+        self.settings = dict(settings)
+        with _cache_lock:
+            _PENDING_SAVE["data"] = self.settings
+
+    def run(self):
+        """Write the settings snapshot to disk."""
+        save_settings(self.settings)
+        with _cache_lock:
+            # A later save may already be queued; leave its snapshot
+            if _PENDING_SAVE["data"] is self.settings:
+                _PENDING_SAVE["data"] = None
+
+
 class SettingsDialog(QDialog):
     """
     Modern settings dialog with card-based interface.
@@ -108,8 +220,18 @@ class SettingsDialog(QDialog):
 
         self.setLayout(self.main_layout)
 
-        self.settings = load_settings()
-        self.interval_spin.setValue(self.settings.get("refresh_interval_seconds", 60))
+        # Settings arrive from the thread pool; saving waits until they have
+        self.settings = {}
+        self.save_button.setEnabled(False)
+        self._settings_signals = SettingsLoadSignals()
+        self._settings_signals.settings_loaded.connect(self._on_settings_loaded)
+        QThreadPool.globalInstance().start(SettingsLoadJob(self._settings_signals))
+
+    def _on_settings_loaded(self, settings):
+        """Fill in the dialog once its settings have been loaded."""
+        self.settings = settings
+        self.interval_spin.setValue(settings.get("refresh_interval_seconds", 60))
+        self.save_button.setEnabled(True)
 
     def create_hero_area(self):
         """Creates the hero area with welcome message and icon."""
@@ -123,10 +245,9 @@ class SettingsDialog(QDialog):
 
         # Icon
         icon_label = QLabel()
-        if os.path.exists(get_asset_path("settings_icon.png")):
-            icon_label.setPixmap(
-                QIcon(get_asset_path("settings_icon.png")).pixmap(48, 48)
-            )
+        settings_icon = load_icon("settings_icon.png")
+        if settings_icon:
+            icon_label.setPixmap(settings_icon.pixmap(48, 48))
         else:
             icon_label.setText("⚙️")
             icon_label.setStyleSheet("font-size: 32px;")
@@ -179,6 +300,10 @@ class SettingsDialog(QDialog):
         self.interval_spin = QSpinBox()
         self.interval_spin.setMinimum(10)
         self.interval_spin.setMaximum(3600)
+        # Emit valueChanged once editing finishes, not for every digit typed
+        self.interval_spin.setKeyboardTracking(False)
+        self.interval_spin.setSingleStep(10)
+        self.interval_spin.setAccelerated(True)
         self.interval_spin.setStyleSheet("QSpinBox { padding: 5px; }")
 
         interval_layout.addWidget(self.interval_label)
@@ -198,15 +323,17 @@ class SettingsDialog(QDialog):
 
         # Cancel button
         cancel_button = QPushButton("Cancel")
-        if os.path.exists(get_asset_path("cancel_icon.png")):
-            cancel_button.setIcon(QIcon(get_asset_path("cancel_icon.png")))
+        cancel_icon = load_icon("cancel_icon.png")
+        if cancel_icon:
+            cancel_button.setIcon(cancel_icon)
         cancel_button.setStyleSheet("QPushButton { padding: 8px 15px; }")
         cancel_button.clicked.connect(self.reject)
 
         # Save button
         self.save_button = QPushButton("Save")
-        if os.path.exists(get_asset_path("save_icon.png")):
-            self.save_button.setIcon(QIcon(get_asset_path("save_icon.png")))
+        save_icon = load_icon("save_icon.png")
+        if save_icon:
+            self.save_button.setIcon(save_icon)
         self.save_button.setStyleSheet(
             """
             QPushButton { 
@@ -234,5 +361,5 @@ class SettingsDialog(QDialog):
         Saves settings and closes the dialog.
         """
         self.settings["refresh_interval_seconds"] = self.interval_spin.value()
-        save_settings(self.settings)
+        QThreadPool.globalInstance().start(SettingsSaveJob(self.settings))
         self.accept()
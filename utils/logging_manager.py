@@ -356,25 +356,31 @@ def get_logger(name: str = "raidassist") -> logging.Logger:
     return logger_manager.get_logger(name)
 
 
-def log_context(context: str):
-    """Context manager for hierarchical logging."""
+class _LogContext:
+    """Pushes a logging context for the duration of a with block."""
+
+    __slots__ = ("context",)
+
+    def __init__(self, ctx: str):
+        self.context = ctx
 
-    class LogContext:
-        def __init__(self, ctx: str):
-            self.context = ctx
+    def __enter__(self):
+        logger_manager.push_context(self.context)
+        return self
 
-        def __enter__(self):
-            logger_manager.push_context(self.context)
-            return self
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        logger_manager.pop_context()
+        if exc_type is not None:
+            logger_manager.error(
+                f"Exception in context '{self.context}'", exception=exc_val
+            )
 
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            logger_manager.pop_context()
-            if exc_type is not None:
-                logger_manager.error(
-                    f"Exception in context '{self.context}'", exception=exc_val
-                )
 
-    return LogContext(context)
+def log_context(context: str):
+    """Context manager for hierarchical logging."""
+    # The class is defined once at module level; building it inside this
+    # function made every with block pay for a new class object
+    return _LogContext(context)
 
 
 def handle_exception(func):